@@ -1,16 +1,34 @@
 import json
+import logging
+import queue
+import socket
 import websocket
 import spidev
 import time
 import threading
 
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps  # Returns UTF-8 bytes, sent as a text frame
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+logger = logging.getLogger("XcpGateway")
+
 
 class XcpSpiHandler:
-    def __init__(self, bus=0, device=0, speed_hz=500000):
+    def __init__(self, bus=0, device=0, speed_hz=500000, frame_delay_us=1000):
         self.spi = spidev.SpiDev()
         self.bus = bus
         self.device = device
         self.speed_hz = speed_hz
+        # Gap after the command frame so the slave can process it and re-arm
+        # its DMA; applied by the SPI driver instead of a Python sleep
+        self.frame_delay_us = frame_delay_us
+        # Clocked out to read back the slave's reply; xfer2 does not modify it
+        self.dummy_frame = b'\xAA' * 8
         self.connect()
 
     def connect(self):
@@ -23,19 +41,23 @@ class XcpSpiHandler:
         self.spi.close()
         print("[SPI] Disconnected")
 
-    def send_command(self, command):
-        if len(command) < 8:
-            command += [0x00] * (8 - len(command))
-
-        print(f"[SPI] TX → {[hex(x) for x in command]}")
-        self.spi.xfer2(command)
-        time.sleep(0.001)
+    def _transact(self, frame):
+        """Send one 8-byte XCP frame and return the slave's reply frame."""
+        # The slave re-arms its 8-byte DMA after every frame, so the command
+        # and the two dummy reads have to stay separate transfers.
+        self.spi.xfer2(frame, self.speed_hz, self.frame_delay_us)
+        self.spi.xfer2(self.dummy_frame)
+        return bytes(self.spi.xfer2(self.dummy_frame))
 
-        dummy = [0xAA] * 8
-        self.spi.xfer2(dummy)        
-        response = self.spi.xfer2(dummy)
+    def send_command(self, command):
+        command = bytes(command).ljust(8, b'\x00')
 
-        print(f"[SPI] RX ← {[hex(x) for x in response]}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("[SPI] TX → %s", command.hex(' '))
+        response = self._transact(command)
+        if debug:
+            logger.debug("[SPI] RX ← %s", response.hex(' '))
 
         return response
 
@@ -43,19 +65,16 @@ class XcpSpiHandler:
     
         addr_high = (address >> 24) & 0xFF
         addr_low  = address & 0xFF
-        set_mta_cmd = [0xF6, 0x00, 0x00, 0x00, addr_low, 0x00, 0x00, addr_high]
+        set_mta_cmd = bytes((0xF6, 0x00, 0x00, 0x00, addr_low, 0x00, 0x00, addr_high))
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("[SPI] SET_MTA TX → %s", set_mta_cmd.hex(' '))
 
-        print(f"[SPI] SET_MTA TX → {[hex(x) for x in set_mta_cmd]}")
+        resp = self._transact(set_mta_cmd)
 
-        resp1=self.spi.xfer2(set_mta_cmd)
-        print(f"{[hex(x) for x in resp1]}")
-        time.sleep(0.001)
-        dummy = [0xAA] * 8
-        self.spi.xfer2(dummy)
-        resp=self.spi.xfer2(dummy)
-        
-        # Print RX
-        print(f"[SPI] SET_MTA RX ← {[hex(x) for x in resp]}")
+        if debug:
+            logger.debug("[SPI] SET_MTA RX ← %s", resp.hex(' '))
 
         # Check response
         if resp[0] == 0xFF:
@@ -65,16 +84,20 @@ class XcpSpiHandler:
             print("[SPI] SET_MTA Error")
             return False
         else:
-            print(f"[SPI] Unexpected SET_MTA response: {[hex(x) for x in resp]}")
+            print(f"[SPI] Unexpected SET_MTA response: {resp.hex(' ')}")
             return False
 
 
 class XcpGatewayClient:
+    MAX_BATCH = 32
+
     def __init__(self, ws_url):
         self.ws_url = ws_url
         self.ws = None
         self.connected = False
         self.spi_handler = XcpSpiHandler()
+        self.tx_q = queue.Queue(maxsize=256)
+        self.writer_thread = None
 
     def on_open(self, ws):
         print(f"[WS] Connected to {self.ws_url}")
@@ -88,7 +111,7 @@ class XcpGatewayClient:
     def on_message(self, ws, message):
         """Handle incoming WebSocket messages and perform SPI operations."""
         try:
-            data = json.loads(message)
+            data = json_loads(message)
             cmd = data.get("cmd")
 
             if not cmd:
@@ -100,7 +123,7 @@ class XcpGatewayClient:
             # -----------------------------
             if cmd == "init":
                 con_id = data.get("con_id", "00")
-                ws.send(json.dumps({"res": "init", "con_id": con_id}))
+                self.send_response({"res": "init", "con_id": con_id})
                 print(f"[WS] Init acknowledged (con_id={con_id})")
 
             # -----------------------------
@@ -127,18 +150,18 @@ class XcpGatewayClient:
 
                 # Send SET_MTA once and check response
                 if not self.spi_handler.send_set_mta(address):
-                    ws.send(json.dumps({
+                    self.send_response({
                         "res": "mem_read",
                         "add": addr_str,
                         "value": None,
                         "error": "SET_MTA failed"
-                    }))
+                    })
                     return
 
                 # Construct SPI SHORT_UPLOAD command (0xF5)
                 addr_high = (address >> 24) & 0xFF
                 addr_low = address & 0xFF
-                spi_cmd = [0xF5, num_elements, 0x00, 0x00, addr_low, 0x00, 0x00, addr_high]
+                spi_cmd = bytes((0xF5, num_elements & 0xFF, 0x00, 0x00, addr_low, 0x00, 0x00, addr_high))
                 spi_resp = self.spi_handler.send_command(spi_cmd)
 
                 # Extract the requested number of bytes from response
@@ -146,55 +169,55 @@ class XcpGatewayClient:
                     # Add length checks for safety
                     if size == 8:
                         if len(spi_resp) < 2:
-                            ws.send(json.dumps({
+                            self.send_response({
                                 "res": "mem_read",
                                 "add": addr_str,
                                 "value": None,
                                 "error": "Insufficient response length for 8-bit"
-                            }))
+                            })
                             print("[WS] Insufficient response length for 8-bit")
                             return
                         value = spi_resp[1]
                     elif size == 16:
                         if len(spi_resp) < 3:
-                            ws.send(json.dumps({
+                            self.send_response({
                                 "res": "mem_read",
                                 "add": addr_str,
                                 "value": None,
                                 "error": "Insufficient response length for 16-bit"
-                            }))
+                            })
                             print("[WS] Insufficient response length for 16-bit")
                             return
-                        value = (spi_resp[2] << 8) | spi_resp[1]  # Little-endian 16-bit
+                        value = int.from_bytes(spi_resp[1:3], 'little')  # Little-endian 16-bit
                     elif size == 32:
                         if len(spi_resp) < 5:
-                            ws.send(json.dumps({
+                            self.send_response({
                                 "res": "mem_read",
                                 "add": addr_str,
                                 "value": None,
                                 "error": "Insufficient response length for 32-bit"
-                            }))
+                            })
                             print("[WS] Insufficient response length for 32-bit")
                             return
-                        value = (spi_resp[4] << 24) | (spi_resp[3] << 16) | (spi_resp[2] << 8) | spi_resp[1]  # Little-endian 32-bit
+                        value = int.from_bytes(spi_resp[1:5], 'little')  # Little-endian 32-bit
                     else:
                         value = 0  # Fallback for unsupported sizes
                     # Format as binary string with correct bit-width
                     binary_value = f"0b{value:0{size}b}"
-                    ws.send(json.dumps({
+                    self.send_response({
                         "res": "mem_read",
                         "add": addr_str,
                         "value": binary_value
-                    }))
+                    })
                     print(f"[WS] Sent mem_read response: {binary_value}")
                 else:
-                    ws.send(json.dumps({
+                    self.send_response({
                         "res": "mem_read",
                         "add": addr_str,
                         "value": None,
                         "error": "SHORT_UPLOAD failed"
-                    }))
-                    print(f"[WS] SHORT_UPLOAD failed: {[hex(x) for x in spi_resp]}")
+                    })
+                    print(f"[WS] SHORT_UPLOAD failed: {spi_resp.hex(' ')}")
 
             # -----------------------------
             # MEMORY WRITE COMMAND
@@ -212,23 +235,24 @@ class XcpGatewayClient:
 
                 # Send SET_MTA once and check response
                 if not self.spi_handler.send_set_mta(address):
-                    ws.send(json.dumps({
+                    self.send_response({
                         "res": "mem_write",
                         "add": addr_str,
                         "state": "SET_MTA failed"
-                    }))
+                    })
                     return
 
                 # Construct SPI write command (example)
-                spi_cmd = [0xF2, data_byte, size, 0x00, 0x00, 0x00, 0x00, 0x00]
+                # Only the low byte of each field fits the 8-bit SPI frame
+                spi_cmd = bytes((0xF2, data_byte & 0xFF, size & 0xFF, 0x00, 0x00, 0x00, 0x00, 0x00))
                 spi_resp = self.spi_handler.send_command(spi_cmd)
 
                 write_status = "success" if spi_resp[0] == 0xFF else "fail"
-                ws.send(json.dumps({
+                self.send_response({
                     "res": "mem_write",
                     "add": addr_str,
                     "state": write_status
-                }))
+                })
                 print(f"[WS] Sent mem_write response: {write_status}")
 
             else:
@@ -237,6 +261,27 @@ class XcpGatewayClient:
         except Exception as e:
             print(f"[ERROR] Failed to process message: {e}")
 
+    def send_response(self, response):
+        """Queue a response for the writer thread."""
+        self.tx_q.put(response)
+
+    def _writer(self):
+        """Drain queued responses, sending bursts as one batch frame."""
+        while True:
+            msgs = [self.tx_q.get()]
+            while len(msgs) < self.MAX_BATCH:
+                try:
+                    msgs.append(self.tx_q.get_nowait())
+                except queue.Empty:
+                    break
+
+            # A lone response goes out as-is to keep request/response latency
+            payload = msgs[0] if len(msgs) == 1 else {"type": "batch", "items": msgs}
+            try:
+                self.ws.send(json_dumps(payload))
+            except Exception as e:
+                print(f"[ERROR] Failed to send {len(msgs)} response(s): {e}")
+
     def connect(self):
         print(f"[WS] Connecting to {self.ws_url}...")
         self.ws = websocket.WebSocketApp(
@@ -246,12 +291,22 @@ class XcpGatewayClient:
             on_message=self.on_message
         )
 
-        self.ws_thread = threading.Thread(target=self.ws.run_forever)
+        # Responses are small frames; disable Nagle so they are not held back
+        self.ws_thread = threading.Thread(
+            target=self.ws.run_forever,
+            kwargs={"sockopt": ((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),)}
+        )
         self.ws_thread.daemon = True
         self.ws_thread.start()
 
+        if self.writer_thread is None:
+            self.writer_thread = threading.Thread(target=self._writer)
+            self.writer_thread.daemon = True
+            self.writer_thread.start()
+
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     
     NGROK_WS_URL = "wss://divine-next-lionfish.ngrok-free.app"
 
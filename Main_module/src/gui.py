@@ -1,16 +1,20 @@
 import sys
 import json
 import time
+import logging
 import threading
 import csv
+import struct
+import hashlib
 import unittest
 import traceback
+import contextlib
 from collections import deque
 from pathlib import Path
 from enum import Enum
 from io import StringIO
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
-                             QWidget, QPushButton, QLabel, QTextEdit, QComboBox,
+                             QWidget, QPushButton, QLabel, QTextEdit, QPlainTextEdit, QComboBox,
                              QGroupBox, QSplitter, QStatusBar, QMessageBox, QDialog,
                              QDialogButtonBox, QSpinBox, QGridLayout, QTabWidget,
                              QFileDialog, QCheckBox, QProgressBar, QMenuBar,
@@ -22,7 +26,6 @@ from PyQt5.QtGui import QFont, QColor, QTextCharFormat, QTextCursor, QBrush, QIc
 import pyqtgraph as pg
 import numpy as np
 import os
-import subprocess
 from pathlib import Path
 
 # Import the modified server class
@@ -48,6 +51,89 @@ class TestStatus(Enum):
 
 class DataExporter:
     """Handle data export functionality"""
+    COLUMNS = ['Parameter', 'Value', 'Timestamp', 'Time String']
+    EXCEL_COLUMNS = ['Parameter', 'Value', 'Timestamp', 'Time']
+    ROW_FORMAT = '%s,%r,%r,%s\r\n'  # Same layout csv.writer produces for a row
+    
+    @staticmethod
+    def _csv_field(text):
+        """Quote a field the way csv.writer would if it needs quoting"""
+        if any(ch in text for ch in ',"\r\n'):
+            return '"' + text.replace('"', '""') + '"'
+        return text
+    
+    @staticmethod
+    def snapshot(data_points):
+        """Copy the samples of every parameter as (parameter, values, timestamps) arrays"""
+        return [(param, points.values().copy(), points.times().copy())
+                for param, points in data_points.items() if len(points)]
+    
+    @staticmethod
+    def _columns(series, categorical=None):
+        """Flatten a snapshot into parameter, value, timestamp and time string columns
+
+        Pass pd.Categorical as `categorical` to get the parameter column as
+        integer codes into the parameter names rather than one string per row.
+        """
+        names = [param for param, _, _ in series]
+        # Integer dtype so np.repeat also accepts an empty snapshot
+        lengths = np.array([len(values) for _, values, _ in series], dtype=np.intp)
+        if categorical is not None:
+            params = categorical.from_codes(np.repeat(np.arange(len(names)), lengths),
+                                            categories=names)
+        else:
+            params = np.repeat(np.array(names, dtype=object), lengths)
+        if series:
+            values = np.concatenate([values for _, values, _ in series])
+            timestamps = np.concatenate([timestamps for _, _, timestamps in series])
+        else:
+            # Nothing monitored yet; export just the header
+            values = np.empty(0)
+            timestamps = np.empty(0)
+        
+        # Samples share whole seconds, so format each distinct second only once
+        seconds, index = np.unique(timestamps.astype(np.int64), return_inverse=True)
+        time_strs = np.array([time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+                              for second in seconds.tolist()], dtype=object)[index]
+        return params, values, timestamps, time_strs
+    
+    @staticmethod
+    def write_csv(series, filename):
+        """Write a snapshot to a CSV file"""
+        # Write next to the target and rename, so a failed export never
+        # leaves a truncated file behind
+        tmp_filename = f"{filename}.tmp"
+        try:
+            try:
+                import pandas as pd
+            except ImportError:
+                pd = None
+            
+            if pd is not None:
+                # pandas formats the whole table in C
+                df = pd.DataFrame(dict(zip(DataExporter.COLUMNS,
+                                           DataExporter._columns(series, pd.Categorical))))
+                df.to_csv(tmp_filename, index=False, chunksize=100000)
+            else:
+                # Escape each parameter name once up front, so every row is a
+                # single %-format in C instead of a pass through csv.writer
+                params, values, timestamps, time_strs = DataExporter._columns(
+                    [(DataExporter._csv_field(param), v, t) for param, v, t in series])
+                rows = zip(params.tolist(), values.tolist(), timestamps.tolist(),
+                           time_strs.tolist())
+                with open(tmp_filename, 'w', newline='', buffering=1 << 20) as csvfile:
+                    csvfile.write(','.join(DataExporter.COLUMNS) + '\r\n')
+                    csvfile.writelines(map(DataExporter.ROW_FORMAT.__mod__, rows))
+            
+            os.replace(tmp_filename, filename)
+            logger.info(f"Data exported to {filename}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to export data: {e}")
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            return False
+    
     @staticmethod
     def export_to_csv(data_points, filename=None):
         """Export monitoring data to CSV file"""
@@ -56,22 +142,8 @@ class DataExporter:
                 None, "Save Data", "", "CSV Files (*.csv);;All Files (*)"
             )
         
-        if filename and data_points:
-            try:
-                with open(filename, 'w', newline='') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(['Parameter', 'Value', 'Timestamp', 'Time String'])
-                    
-                    for param, points in data_points.items():
-                        for value, timestamp in points:
-                            time_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
-                            writer.writerow([param, value, timestamp, time_str])
-                
-                logger.info(f"Data exported to {filename}")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to export data: {e}")
-                return False
+        if filename and data_points is not None:
+            return DataExporter.write_csv(DataExporter.snapshot(data_points), filename)
         return False
     
     @staticmethod
@@ -80,19 +152,7 @@ class DataExporter:
         try:
             import pandas as pd
             
-            # Convert data to DataFrame
-            data = []
-            for param, points in data_points.items():
-                for value, timestamp in points:
-                    data.append({
-                        'Parameter': param,
-                        'Value': value,
-                        'Timestamp': timestamp,
-                        'Time': time.strftime('%Y-%m-%d %H:%M:%S', 
-                                             time.localtime(timestamp))
-                    })
-            
-            df = pd.DataFrame(data)
+            series = DataExporter.snapshot(data_points)
             
             if not filename:
                 filename, _ = QFileDialog.getSaveFileName(
@@ -101,16 +161,126 @@ class DataExporter:
                 )
             
             if filename:
-                df.to_excel(filename, index=False)
+                try:
+                    import xlsxwriter
+                except ImportError:
+                    xlsxwriter = None
+                
+                if xlsxwriter is not None:
+                    DataExporter.write_xlsx(xlsxwriter, series, filename)
+                else:
+                    # Convert data to DataFrame
+                    params, values, timestamps, time_strs = DataExporter._columns(
+                        series, pd.Categorical)
+                    df = pd.DataFrame(dict(zip(DataExporter.EXCEL_COLUMNS,
+                                               (params, values, timestamps, time_strs))))
+                    df.to_excel(filename, index=False)
                 return True
         except ImportError:
             logger.error("pandas not installed for Excel export")
         except Exception as e:
             logger.error(f"Failed to export to Excel: {e}")
         return False
+    
+    @staticmethod
+    def write_xlsx(xlsxwriter, series, filename):
+        """Write a snapshot to an Excel file row by row with constant memory"""
+        # constant_memory flushes each row once the next one starts, so cells
+        # must go out in row order; pandas' to_excel writes column by column
+        # and would lose every column but the first
+        workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+        try:
+            worksheet = workbook.add_worksheet('Sheet1')
+            worksheet.write_row(0, 0, DataExporter.EXCEL_COLUMNS)
+            columns = (column.tolist() for column in DataExporter._columns(series))
+            for row, values in enumerate(zip(*columns), start=1):
+                worksheet.write_row(row, 0, values)
+        finally:
+            workbook.close()
+    
+class ExportWorker(QThread):
+    """Thread for writing a CSV export without blocking GUI"""
+    export_completed = pyqtSignal(bool, str)  # success, filename
+    
+    def __init__(self, series, filename):
+        super().__init__()
+        self.series = series
+        self.filename = filename
+    
+    def run(self):
+        success = DataExporter.write_csv(self.series, self.filename)
+        self.export_completed.emit(success, self.filename)
+
+class ChecksumWorker(QThread):
+    """Thread for hashing a firmware file without blocking GUI"""
+    checksum_completed = pyqtSignal(str, str, 'qint64')  # filename, hex digest ('' on error), size
+    
+    CHUNK_SIZE = 1 << 20  # Hash in 1 MiB pieces instead of reading the whole image
+    
+    def __init__(self, filename):
+        super().__init__()
+        self.filename = filename
+    
+    def run(self):
+        digest = hashlib.md5()
+        try:
+            with open(self.filename, 'rb') as f:
+                # Size of the same file that is hashed, without a second stat
+                file_size = os.fstat(f.fileno()).st_size
+                for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b''):
+                    digest.update(chunk)
+        except OSError as e:
+            logger.error(f"Failed to checksum {self.filename}: {e}")
+            self.checksum_completed.emit(self.filename, "", -1)
+            return
+        self.checksum_completed.emit(self.filename, digest.hexdigest(), file_size)
+
+class ElfConvertWorker(QThread):
+    """Thread for converting the ELF file to a variable CSV without blocking GUI"""
+    conversion_completed = pyqtSignal(str, str)  # CSV path ('' on error), error message
+    
+    def run(self):
+        try:
+            # Imported here so a missing pyelftools only affects this feature
+            import mem_map_byelf
+            output_csv, _ = mem_map_byelf.convert()
+        except Exception as e:
+            logger.error(f"ELF to CSV conversion failed: {e}")
+            self.conversion_completed.emit("", str(e) or type(e).__name__)
+            return
+        self.conversion_completed.emit(output_csv, "")
 
 class VariableManager:
     """Manage variables from CSV file"""
+    # Size in bytes of one element of each data type
+    ELEMENT_SIZES = {
+        'uint8_t': 1,
+        'int8_t': 1,
+        'uint16_t': 2,
+        'int16_t': 2,
+        'uint32_t': 4,
+        'int32_t': 4,
+        'float': 4,
+        'double': 8
+    }
+    
+    # Common data type spellings and the type they are corrected to
+    TYPE_CORRECTIONS = {
+        'uint32': 'uint32_t',
+        'int32': 'int32_t',
+        'uint16': 'uint16_t',
+        'int16': 'int16_t',
+        'uint8': 'uint8_t',
+        'int8': 'int8_t',
+        'unsigned int': 'uint32_t',
+        'signed int': 'int32_t',
+        'unsigned short': 'uint16_t',
+        'signed short': 'int16_t',
+        'unsigned char': 'uint8_t',
+        'signed char': 'int8_t',
+        'char': 'int8_t'
+    }
+    
     def __init__(self):
         self.variables = []
         
@@ -123,22 +293,26 @@ class VariableManager:
                 # Skip header if exists
                 next(reader, None)
                 
+                debug = logger.isEnabledFor(logging.DEBUG)
                 for row in reader:
                     if len(row) >= 4:
                         # Clean and validate data type
                         cleaned_data_type = self.validate_and_clean_data_type(row[3].strip())
+                        elements = int(row[2])
                         
                         var_data = {
                             'name': row[0].strip(),
                             'address': row[1].strip(),
-                            'elements': int(row[2]),
+                            'elements': elements,
                             'data_type': cleaned_data_type,  # Use cleaned type
-                            'current_values': [0] * int(row[2])
+                            'current_values': [0] * elements
                         }
                         variables.append(var_data)
-                        logger.info(f"Loaded variable: {var_data}")
+                        if debug:
+                            logger.debug("Loaded variable: %s", var_data)
             
             self.variables = variables
+            logger.info("Loaded %d variables from %s", len(variables), filename)
             return True
         except Exception as e:
             logger.error(f"Failed to load CSV: {e}")
@@ -149,29 +323,11 @@ class VariableManager:
         # Remove extra spaces and standardize format
         cleaned = data_type_str.strip()
         
-        # Common corrections
-        corrections = {
-            'uint32': 'uint32_t',
-            'int32': 'int32_t',
-            'uint16': 'uint16_t',
-            'int16': 'int16_t',
-            'uint8': 'uint8_t',
-            'int8': 'int8_t',
-            'unsigned int': 'uint32_t',
-            'signed int': 'int32_t',
-            'unsigned short': 'uint16_t',
-            'signed short': 'int16_t',
-            'unsigned char': 'uint8_t',
-            'signed char': 'int8_t',
-            'char': 'int8_t'
-        }
-        
         # Check if correction needed
-        lower_cleaned = cleaned.lower()
-        for wrong, right in corrections.items():
-            if lower_cleaned == wrong:
-                logger.info(f"Corrected data type '{data_type_str}' to '{right}'")
-                return right
+        right = self.TYPE_CORRECTIONS.get(cleaned.lower())
+        if right is not None:
+            logger.debug("Corrected data type '%s' to '%s'", data_type_str, right)
+            return right
         
         return cleaned
     
@@ -181,35 +337,110 @@ class VariableManager:
         base_address = int(base_address_str, 16)
         
         # Determine size based on data type
-        size_map = {
-            'uint8_t': 1,
-            'int8_t': 1,
-            'uint16_t': 2,
-            'int16_t': 2,
-            'uint32_t': 4,
-            'int32_t': 4,
-            'float': 4,
-            'double': 8
-        }
-        
-        element_size = size_map.get(data_type, 1)
-        addresses = []
+        element_size = self.ELEMENT_SIZES.get(data_type, 1)
         
-        for i in range(num_elements):
-            addresses.append(base_address + (i * element_size))
-            
-        return addresses
+        # Elements are evenly spaced, so let range do the arithmetic in C
+        return list(range(base_address, base_address + num_elements * element_size,
+                          element_size))
     
     def address_to_bytes(self, address):
         """Convert address to byte array for SET_MTA command"""
-        # Convert to 4-byte array (little-endian or big-endian as needed)
-        bytes_array = [
-            (address >> 24) & 0xFF,
-            (address >> 16) & 0xFF,
-            (address >> 8) & 0xFF,
-            address & 0xFF
-        ]
-        return bytes_array
+        # Convert to 4-byte array, most significant byte first
+        return list((address & 0xFFFFFFFF).to_bytes(4, 'big'))
+
+class SampleTable:
+    """Fixed-size sample history of every parameter in shared NumPy arrays.
+
+    Each parameter gets an integer id and one row of the value and
+    timestamp tables. Every sample is written twice (at i and
+    i + capacity), so the newest `capacity` samples of a row are always
+    one contiguous slice.
+    """
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self.ids = {}
+        self._values = np.zeros((0, 2 * capacity))
+        self._times = np.zeros((0, 2 * capacity))
+        self._head = []
+        self._count = []
+
+    def add_parameter(self, parameter):
+        """Return the row id of a parameter, allocating a row if needed"""
+        pid = self.ids.get(parameter)
+        if pid is None:
+            pid = len(self.ids)
+            if pid == len(self._values):
+                # Grow in steps so rows are rarely reallocated
+                extra = max(4, pid)
+                self._values = np.vstack((self._values, np.zeros((extra, 2 * self.capacity))))
+                self._times = np.vstack((self._times, np.zeros((extra, 2 * self.capacity))))
+            self.ids[parameter] = pid
+            self._head.append(0)
+            self._count.append(0)
+        return pid
+
+    def append(self, pid, value, timestamp):
+        """Store a sample in a row, overwriting its oldest one when full"""
+        head = self._head[pid]
+        capacity = self.capacity
+        self._values[pid, head] = self._values[pid, head + capacity] = value
+        self._times[pid, head] = self._times[pid, head + capacity] = timestamp
+        self._head[pid] = (head + 1) % capacity
+        if self._count[pid] < capacity:
+            self._count[pid] += 1
+
+    def _window(self, pid):
+        count = self._count[pid]
+        start = self._head[pid] + self.capacity - count
+        return slice(start, start + count)
+
+    def values(self, pid):
+        """Values of a row in arrival order (read-only view)"""
+        return self._values[pid, self._window(pid)]
+
+    def times(self, pid):
+        """Timestamps of a row in arrival order (read-only view)"""
+        return self._times[pid, self._window(pid)]
+
+    def get(self, parameter, default=None):
+        pid = self.ids.get(parameter)
+        return default if pid is None else SampleRow(self, pid)
+
+    def items(self):
+        """(parameter, SampleRow) pairs for every known parameter"""
+        return [(parameter, SampleRow(self, pid)) for parameter, pid in self.ids.items()]
+
+    def clear(self):
+        """Drop all samples, keeping the parameter rows"""
+        self._head = [0] * len(self._head)
+        self._count = [0] * len(self._count)
+
+    def __contains__(self, parameter):
+        return parameter in self.ids
+
+    def __bool__(self):
+        return any(self._count)
+
+class SampleRow:
+    """View of one parameter's samples in a SampleTable"""
+    def __init__(self, table, pid):
+        self.table = table
+        self.pid = pid
+
+    def values(self):
+        return self.table.values(self.pid)
+
+    def times(self):
+        return self.table.times(self.pid)
+
+    def __len__(self):
+        return self.table._count[self.pid]
+
+    def __iter__(self):
+        return zip(self.values().tolist(), self.times().tolist())
+
+    def __getitem__(self, index):
+        return self.values()[index], self.times()[index]
 
 class RealTimePlotWidget(pg.PlotWidget):
     def __init__(self, parent=None, title="Real-time Data", y_label="Value"):
@@ -221,10 +452,26 @@ class RealTimePlotWidget(pg.PlotWidget):
         self.setBackground('w')
         self.showGrid(x=True, y=True)
         
+        # Render cost follows visible pixels rather than buffered samples
+        self.setDownsampling(auto=True, mode='peak')
+        self.setClipToView(True)
+        self.setAntialiasing(False)
+        
         self.data_curves = {}
-        self.data_points = {}
+        self.curve_visible = {}  # Last visibility applied to each curve
+        self.data_points = SampleTable(1000)
         self.visible_parameters = set()
         
+        # Samples are buffered as they arrive and curves are redrawn at a
+        # fixed rate, so paint cost does not scale with the sample rate
+        self.dirty_parameters = set()
+        # Hidden curves are not redrawn; they catch up when shown again
+        self.stale_parameters = set()
+        # The timer only runs while there is something to redraw
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(33)
+        self.refresh_timer.timeout.connect(self.refresh_curves)
+        
     def set_visible_parameters(self, parameters):
         """Set which parameters should be visible on the plot"""
         self.visible_parameters = set(parameters)
@@ -232,67 +479,113 @@ class RealTimePlotWidget(pg.PlotWidget):
         
     def update_plot_visibility(self):
         """Show/hide curves based on visible parameters"""
+        show_all = not self.visible_parameters
         for param, curve in self.data_curves.items():
-            curve.setVisible(param in self.visible_parameters or not self.visible_parameters)
+            visible = show_all or param in self.visible_parameters
+            # Skip curves already in the wanted state to avoid redundant Qt calls
+            if self.curve_visible.get(param) != visible:
+                if visible and param in self.stale_parameters:
+                    self.stale_parameters.discard(param)
+                    points = self.data_points.get(param)
+                    if points is not None:
+                        curve.setData(points.times().copy(), points.values().copy())
+                curve.setVisible(visible)
+                self.curve_visible[param] = visible
+        
+    def create_curve(self, parameter):
+        """Create the line curve for a parameter"""
+        # Generate color based on parameter count
+        color = pg.intColor(len(self.data_curves) * 30, hues=9, maxValue=200)
+        
+        # Line-only curve; per-point symbols are far slower to render
+        curve = self.plot([], [], name=parameter, pen=pg.mkPen(color=color, width=2))
+        
+        # Set visibility based on current filter
+        visible = (not self.visible_parameters) or (parameter in self.visible_parameters)
+        curve.setVisible(visible)
+        self.data_curves[parameter] = curve
+        self.curve_visible[parameter] = visible
+        logger.info("Created new plot curve for parameter: %s", parameter)
+        return curve
+    
+    def prepare_curves(self, parameters):
+        """Create curves and sample rows for all known parameters before data arrives"""
+        for parameter in parameters:
+            if parameter not in self.data_curves:
+                self.create_curve(parameter)
+            self.data_points.add_parameter(parameter)
         
     def update_plot(self, parameter, value, timestamp):
         """Update plot with new data point"""
         try:
-            # Log incoming data for debugging
-            logger.debug(f"Plot update - Parameter: {parameter}, Value: {value}, Time: {timestamp}")
+            data_points = self.data_points
+            dirty = self.dirty_parameters
             
-            # Initialize deque for this parameter if it doesn't exist
-            if parameter not in self.data_points:
-                self.data_points[parameter] = deque(maxlen=1000)
-                logger.info(f"Created new data deque for parameter: {parameter}")
+            # Look up the table row for this parameter, allocating it on first use
+            pid = data_points.ids.get(parameter)
+            if pid is None:
+                pid = data_points.add_parameter(parameter)
+                logger.info("Created new data buffer for parameter: %s", parameter)
             
             # Add new data point
-            self.data_points[parameter].append((value, timestamp))
+            data_points.append(pid, value, timestamp)
             
-            # Create or update the curve for this parameter
+            # Create the curve if this parameter was not known up-front
             if parameter not in self.data_curves:
-                # Generate color based on parameter count
-                color = pg.intColor(len(self.data_curves) * 30, hues=9, maxValue=200)
-                
-                # Create new curve
-                self.data_curves[parameter] = self.plot(
-                    [], [], 
-                    name=parameter, 
-                    pen=pg.mkPen(color=color, width=2),
-                    symbol='o',
-                    symbolSize=5,
-                    symbolBrush=color
-                )
-                logger.info(f"Created new plot curve for parameter: {parameter}")
-                
-                # Set visibility based on current filter
-                is_visible = (not self.visible_parameters) or (parameter in self.visible_parameters)
-                self.data_curves[parameter].setVisible(is_visible)
-                logger.debug(f"Set {parameter} visibility to {is_visible}")
-            
-            # Extract data for this parameter
-            times = [point[1] for point in self.data_points[parameter]]
-            values = [point[0] for point in self.data_points[parameter]]
+                self.create_curve(parameter)
             
-            # Update the curve with new data
-            if times and values:
-                self.data_curves[parameter].setData(times, values)
-                logger.debug(f"Updated curve for {parameter} with {len(values)} points")
-                
-                # Auto-range if this is the only visible parameter or all are visible
-                if not self.visible_parameters or parameter in self.visible_parameters:
-                    self.enableAutoRange()
+            # Redraw on the next refresh tick. The timer only stops after a
+            # tick with nothing dirty, so it can only be idle if the set is empty.
+            if not dirty and not self.refresh_timer.isActive():
+                self.refresh_timer.start()
+            dirty.add(parameter)
             
         except Exception as e:
             logger.error(f"Error updating plot for {parameter}: {e}")
-            import traceback
             logger.error(traceback.format_exc())
     
+    def refresh_curves(self):
+        """Push buffered samples of changed parameters to their curves"""
+        if not self.dirty_parameters:
+            # Nothing arrived since the last tick; sleep until the next sample
+            self.refresh_timer.stop()
+            return
+        
+        dirty, self.dirty_parameters = self.dirty_parameters, set()
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        for parameter in dirty:
+            points = self.data_points.get(parameter)
+            curve = self.data_curves.get(parameter)
+            if curve is None or not points:
+                continue
+            if not self.curve_visible.get(parameter, True):
+                # Skip the path rebuild and decimation of a curve nobody sees
+                self.stale_parameters.add(parameter)
+                continue
+            
+            # pyqtgraph keeps the arrays it is given; hand it copies, since
+            # the ring buffer views are overwritten once the row wraps
+            curve.setData(points.times().copy(), points.values().copy())
+            if debug:
+                logger.debug("Updated curve for %s with %d points", parameter, len(points))
+    
     def clear_data(self):
         """Clear all plot data"""
+        # Only curves that were given samples need emptying; share one
+        # empty array between them instead of converting [] per curve
+        drawn = [parameter for parameter, points in self.data_points.items() if len(points)]
         self.data_points.clear()
-        for curve in self.data_curves.values():
-            curve.setData([], [])
+        self.dirty_parameters.clear()
+        self.stale_parameters.clear()
+        empty = np.empty(0)
+        for parameter in drawn:
+            curve = self.data_curves.get(parameter)
+            if curve is not None:
+                curve.setData(empty, empty)
+        # Auto-range follows new data on its own and is not forced every
+        # frame, so a user pan/zoom sticks until the data is cleared
+        self.enableAutoRange()
 
 class TestRunner(QThread):
     """Thread for running tests without blocking GUI"""
@@ -302,6 +595,8 @@ class TestRunner(QThread):
     suite_completed = pyqtSignal(dict)
     log_message = pyqtSignal(str, str)  # message, level
     
+    TEST_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'test')
+    
     def __init__(self, test_suite, test_cases=None):
         super().__init__()
         self.test_suite = test_suite
@@ -327,21 +622,22 @@ class TestRunner(QThread):
                 self.run_all_tests()
         except Exception as e:
             self.log_message.emit(f"Test execution error: {str(e)}", "error")
-            import traceback
             self.log_message.emit(traceback.format_exc(), "error")
             self.suite_completed.emit(self.overall_results)
     
+    @classmethod
+    def add_test_path(cls):
+        """Put the test folder on sys.path once and return it"""
+        # Test modules are imported once and then served from sys.modules
+        if cls.TEST_PATH not in sys.path:
+            sys.path.insert(0, cls.TEST_PATH)
+        return cls.TEST_PATH
+    
     def run_websocket_tests(self):
         """Run WebSocket server tests"""
         try:
-            import sys
-            import os
-            import traceback
-            
             # Add the test folder to path
-            test_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'test')
-            if test_path not in sys.path:
-                sys.path.insert(0, test_path)
+            test_path = self.add_test_path()
             
             self.log_message.emit(f"Looking for WebSocket tests in: {test_path}", "info")
             
@@ -398,7 +694,6 @@ class TestRunner(QThread):
                 
         except Exception as e:
             self.log_message.emit(f"WebSocket test error: {str(e)}", "error")
-            import traceback
             self.log_message.emit(traceback.format_exc(), "error")
             self.suite_completed.emit({
                 'total': 0,
@@ -411,14 +706,8 @@ class TestRunner(QThread):
     def run_json_handler_tests(self):
         """Run JSON handler tests"""
         try:
-            import sys
-            import os
-            import traceback
-            
             # Add the test folder to path
-            test_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'test')
-            if test_path not in sys.path:
-                sys.path.insert(0, test_path)
+            test_path = self.add_test_path()
             
             self.log_message.emit(f"Looking for JSON Handler tests in: {test_path}", "info")
             
@@ -458,15 +747,15 @@ class TestRunner(QThread):
                 if test_functions:
                     total_tests = len(test_functions)
                     current = 0
+                    # One capture buffer, emptied before each test
+                    f = StringIO()
                     
                     for test_name, test_func in test_functions:
                         self.test_started.emit(test_name)
+                        f.seek(0)
+                        f.truncate()
                         try:
                             # Capture output
-                            import io
-                            import contextlib
-                            
-                            f = io.StringIO()
                             with contextlib.redirect_stdout(f):
                                 test_func()
                             output = f.getvalue()
@@ -549,7 +838,6 @@ class TestRunner(QThread):
             
             for i, (test_name, success, message) in enumerate(tests):
                 self.test_started.emit(test_name)
-                time.sleep(0.2)  # Simulate test execution
                 
                 if success:
                     passed_count += 1
@@ -580,8 +868,6 @@ class TestRunner(QThread):
     def run_test_suite(self, suite, name):
         """Run a unittest suite"""
         try:
-            from io import StringIO
-            
             stream = StringIO()
             runner = unittest.TextTestRunner(stream=stream, verbosity=2)
             
@@ -654,13 +940,11 @@ class TestRunner(QThread):
             
             self.log_message.emit("Starting all tests...", "info")
             
-            # Run each test suite
+            # Run each test suite back to back. They stay sequential: the
+            # JSON handler tests capture output through redirect_stdout,
+            # which is process-wide and would swallow other suites' prints.
             self.run_websocket_tests()
-            time.sleep(0.5)
-            
             self.run_json_handler_tests()
-            time.sleep(0.5)
-            
             self.run_integration_tests()
             
             # Note: The individual test methods will emit suite_completed
@@ -668,19 +952,44 @@ class TestRunner(QThread):
             
         except Exception as e:
             self.log_message.emit(f"Error running all tests: {str(e)}", "error")
-            import traceback
             self.log_message.emit(traceback.format_exc(), "error")
 
 
 class TestingTab(QWidget):
     """Testing and diagnostics tab for the GUI"""
     
+    # Output text color for each log level
+    OUTPUT_COLORS = {
+        'info': '#d4d4d4',
+        'success': '#4ec9b0',
+        'warning': '#ce9178',
+        'error': '#f48771',
+        'debug': '#9cdcfe'
+    }
+    OUTPUT_MAX_LINES = 5000
+    
+    # Status cell backgrounds of the results tree
+    RUNNING_BRUSH = QBrush(QColor(255, 255, 200))
+    PASSED_BRUSH = QBrush(QColor(200, 255, 200))
+    FAILED_BRUSH = QBrush(QColor(255, 200, 200))
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
         self.test_runner = None
         self.test_history = []
         self.test_start_time = None
+        self.result_items = {}  # Test name -> its row in the results tree
+        self.pending_results = []  # Row updates held while the Results tab is hidden
+        # Output lines are queued and inserted together on a short timer
+        self.pending_output = []
+        self.output_formats = {}
+        for level, color in self.OUTPUT_COLORS.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(QBrush(QColor(color)))
+            self.output_formats[level] = fmt
+        self.timestamp_format = QTextCharFormat()
+        self.timestamp_format.setForeground(QBrush(QColor('#808080')))
         self.init_ui()
         
     def init_ui(self):
@@ -778,15 +1087,13 @@ class TestingTab(QWidget):
         self.output_widget = QWidget()
         output_layout = QVBoxLayout(self.output_widget)
         
-        self.output_text = QTextBrowser()
-        self.output_text.setStyleSheet("""
-            QTextBrowser {
-                background-color: #1e1e1e;
-                color: #d4d4d4;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 10pt;
-            }
-        """)
+        # Append-only colored lines; no rich-text or hyperlink support needed
+        self.output_text = QPlainTextEdit()
+        self.output_text.setReadOnly(True)
+        self.output_text.setUndoRedoEnabled(False)  # No undo history for a read-only log
+        self.output_text.setObjectName("testOutput")
+        # Keep only the newest lines so long runs do not grow the document
+        self.output_text.setMaximumBlockCount(self.OUTPUT_MAX_LINES)
         output_layout.addWidget(self.output_text)
         
         # Test History Tab
@@ -801,6 +1108,7 @@ class TestingTab(QWidget):
         coverage_layout = QVBoxLayout(self.coverage_widget)
         
         self.coverage_text = QTextBrowser()
+        self.coverage_text.setUndoRedoEnabled(False)
         coverage_layout.addWidget(self.coverage_text)
         
         # Add tabs
@@ -828,36 +1136,36 @@ class TestingTab(QWidget):
         
     def populate_test_tree(self):
         """Populate test tree with available tests"""
-        # WebSocket Server Tests
-        ws_item = QTreeWidgetItem(self.test_tree, ["WebSocket Server Tests"])
-        ws_item.setCheckState(0, Qt.Unchecked)
-        
-        ws_tests = ["Basic Functionality", "Integration", "Edge Cases", "Performance"]
-        for test in ws_tests:
-            child = QTreeWidgetItem(ws_item, [test])
-            child.setCheckState(0, Qt.Unchecked)
-        
-        # JSON Handler Tests
-        json_item = QTreeWidgetItem(self.test_tree, ["JSON Handler Tests"])
-        json_item.setCheckState(0, Qt.Unchecked)
-        
-        json_tests = ["Message Processing", "Command Creation", 
-                     "Error Conditions", "Edge Cases"]
-        for test in json_tests:
-            child = QTreeWidgetItem(json_item, [test])
-            child.setCheckState(0, Qt.Unchecked)
-        
-        # Integration Tests
-        integ_item = QTreeWidgetItem(self.test_tree, ["Integration Tests"])
-        integ_item.setCheckState(0, Qt.Unchecked)
-        
-        integ_tests = ["WebSocket-JSON Integration", "Monitoring Integration", 
-                      "Data Flow", "OTA Integration"]
-        for test in integ_tests:
-            child = QTreeWidgetItem(integ_item, [test])
-            child.setCheckState(0, Qt.Unchecked)
+        suites = [
+            ("WebSocket Server Tests",
+             ["Basic Functionality", "Integration", "Edge Cases", "Performance"]),
+            ("JSON Handler Tests",
+             ["Message Processing", "Command Creation",
+              "Error Conditions", "Edge Cases"]),
+            ("Integration Tests",
+             ["WebSocket-JSON Integration", "Monitoring Integration",
+              "Data Flow", "OTA Integration"]),
+        ]
         
-        self.test_tree.expandAll()
+        # Build the items detached and insert them in one call, with the tree
+        # laid out once at the end
+        self.test_tree.setUpdatesEnabled(False)
+        try:
+            suite_items = []
+            for suite_name, tests in suites:
+                suite_item = QTreeWidgetItem([suite_name])
+                suite_item.setCheckState(0, Qt.Unchecked)
+                children = []
+                for test in tests:
+                    child = QTreeWidgetItem([test])
+                    child.setCheckState(0, Qt.Unchecked)
+                    children.append(child)
+                suite_item.addChildren(children)
+                suite_items.append(suite_item)
+            self.test_tree.addTopLevelItems(suite_items)
+            self.test_tree.expandAll()
+        finally:
+            self.test_tree.setUpdatesEnabled(True)
         
     def setup_connections(self):
         """Setup signal connections for TestingTab"""
@@ -872,6 +1180,9 @@ class TestingTab(QWidget):
         
         # History interaction
         self.history_list.itemDoubleClicked.connect(self.load_history_item)
+        
+        # Catch up on result rows when the Results tab is shown
+        self.result_tabs.currentChanged.connect(self.apply_pending_results)
     
     def run_selected_tests(self):
         """Run selected tests"""
@@ -915,25 +1226,55 @@ class TestingTab(QWidget):
     def on_test_started(self, test_name):
         """Handle test start signal"""
         self.add_output(f"▶️ Running: {test_name}", "info")
-        
-        item = QTreeWidgetItem(self.results_tree, [test_name, "🔄 Running", "", ""])
-        item.setBackground(1, QBrush(QColor(255, 255, 200)))
+        self.queue_result(test_name, None, "")
     
     def on_test_completed(self, test_name, success, details):
         """Handle test completion signal"""
-        for i in range(self.results_tree.topLevelItemCount()):
-            item = self.results_tree.topLevelItem(i)
-            if item.text(0) == test_name:
-                if success:
-                    item.setText(1, "✅ Passed")
-                    item.setBackground(1, QBrush(QColor(200, 255, 200)))
-                    self.add_output(f"✅ Passed: {test_name}", "success")
-                else:
-                    item.setText(1, "❌ Failed")
-                    item.setBackground(1, QBrush(QColor(255, 200, 200)))
-                    item.setText(3, details[:100] + "..." if len(details) > 100 else details)
-                    self.add_output(f"❌ Failed: {test_name}\n{details}", "error")
-                break
+        if success:
+            self.add_output(f"✅ Passed: {test_name}", "success")
+        else:
+            self.add_output(f"❌ Failed: {test_name}\n{details}", "error")
+        self.queue_result(test_name, success, details)
+    
+    def queue_result(self, test_name, success, details):
+        """Update a results row now, or once the Results tab is shown"""
+        # A hidden tree would still be laid out on every change
+        if self.result_tabs.currentWidget() is self.results_widget:
+            self.apply_result(test_name, success, details)
+        else:
+            self.pending_results.append((test_name, success, details))
+    
+    def apply_pending_results(self):
+        """Replay results that arrived while the Results tab was hidden"""
+        if not self.pending_results or self.result_tabs.currentWidget() is not self.results_widget:
+            return
+        self.results_tree.setUpdatesEnabled(False)
+        try:
+            for result in self.pending_results:
+                self.apply_result(*result)
+        finally:
+            self.results_tree.setUpdatesEnabled(True)
+        self.pending_results.clear()
+    
+    def apply_result(self, test_name, success, details):
+        """Add a running row (success is None) or mark an existing row"""
+        if success is None:
+            item = QTreeWidgetItem(self.results_tree, [test_name, "🔄 Running", "", ""])
+            item.setBackground(1, self.RUNNING_BRUSH)
+            self.result_items[test_name] = item
+            return
+        
+        item = self.result_items.get(test_name)
+        if item is None:
+            return
+        
+        if success:
+            item.setText(1, "✅ Passed")
+            item.setBackground(1, self.PASSED_BRUSH)
+        else:
+            item.setText(1, "❌ Failed")
+            item.setBackground(1, self.FAILED_BRUSH)
+            item.setText(3, details[:100] + "..." if len(details) > 100 else details)
     
     def on_test_progress(self, current, total):
         """Update progress bar"""
@@ -968,30 +1309,39 @@ class TestingTab(QWidget):
     
     def add_output(self, text, level="info"):
         """Add text to output with color coding"""
-        colors = {
-            'info': '#d4d4d4',
-            'success': '#4ec9b0',
-            'warning': '#ce9178',
-            'error': '#f48771',
-            'debug': '#9cdcfe'
-        }
-        
-        color = colors.get(level, '#d4d4d4')
         timestamp = QDateTime.currentDateTime().toString('hh:mm:ss.zzz')
         
-        formatted_text = f'<span style="color: #808080">[{timestamp}]</span> '
-        formatted_text += f'<span style="color: {color}">{text}</span><br>'
+        if not self.pending_output:
+            # Coalesce bursts of log lines into a single insert
+            QTimer.singleShot(30, self.flush_output)
+        self.pending_output.append((timestamp, text, level))
+    
+    def flush_output(self):
+        """Insert all queued output lines as one edit"""
+        if not self.pending_output:
+            return
         
+        # Plain text with prebuilt formats; no HTML parsing per line
+        formats = self.output_formats
         cursor = self.output_text.textCursor()
         cursor.movePosition(QTextCursor.End)
-        self.output_text.insertHtml(formatted_text)
+        cursor.beginEditBlock()
+        for timestamp, text, level in self.pending_output:
+            cursor.insertText(f"[{timestamp}] ", self.timestamp_format)
+            cursor.insertText(f"{text}\n", formats.get(level, formats['info']))
+        cursor.endEditBlock()
+        self.pending_output.clear()
         
         if self.auto_scroll_check.isChecked():
+            self.output_text.setTextCursor(cursor)
             self.output_text.ensureCursorVisible()
     
     def clear_results(self):
         """Clear all test results"""
         self.results_tree.clear()
+        self.result_items.clear()
+        self.pending_results.clear()
+        self.pending_output.clear()
         self.output_text.clear()
         self.progress_bar.setValue(0)
     
@@ -1004,6 +1354,7 @@ class TestingTab(QWidget):
         )
         
         if filename:
+            self.flush_output()
             try:
                 if filename.endswith('.html'):
                     self.export_html(filename)
@@ -1039,9 +1390,29 @@ class TestingTab(QWidget):
         QMessageBox.information(self, "History", "Loading historical test run...")
 
 class DataMonitorGUI(QMainWindow):
-    data_received = pyqtSignal(str, float, float)  # parameter, value, timestamp
     log_message = pyqtSignal(str)  # NEW: For thread-safe logging
     operation_log_message = pyqtSignal(str)  # NEW: For thread-safe operation log
+    ota_status_changed = pyqtSignal(str, str)  # OTA status value, message
+    ota_progress_changed = pyqtSignal(int)
+    ota_log_message = pyqtSignal(str)
+    server_shutdown_finished = pyqtSignal()
+    
+    LOG_MAX_LINES = 1000  # Event log scrollback
+    
+    # Little-endian packers used by value_to_bytes, compiled once
+    VALUE_PACKERS = {
+        data_type: struct.Struct('<' + fmt)
+        for data_type, fmt in (
+            ('uint8_t', 'B'),
+            ('int8_t', 'b'),
+            ('uint16_t', 'H'),
+            ('int16_t', 'h'),
+            ('uint32_t', 'I'),
+            ('int32_t', 'i'),
+            ('float', 'f'),
+            ('double', 'd'),
+        )
+    }
     
     def __init__(self):
         super().__init__()
@@ -1062,25 +1433,68 @@ class DataMonitorGUI(QMainWindow):
         # Create server instance
         self.server = WebSocketServer()
         self.server.data_callback = self.on_data_received
+        self.shutdown_thread = None
+        self.server_stopped = False
+        self.server_shutdown_finished.connect(self.on_server_shutdown_finished)
+        
+        # OTA updates run on the handler's own thread; its callbacks are
+        # re-emitted as signals so the widgets are only touched by the GUI thread
+        self.ota_handler = OTAHandler(self.server)
+        self.ota_handler.set_callbacks(
+            status_cb=self.emit_ota_status,
+            progress_cb=self.ota_progress_changed.emit,
+            log_cb=self.ota_log_message.emit
+        )
         
         # Store response data
         self.pending_responses = {}
         
+        # Event log lines waiting for the next flush. The log widget keeps only
+        # the newest LOG_MAX_LINES lines, so older pending lines are dropped here.
+        self.log_buffer = deque(maxlen=self.LOG_MAX_LINES)
+        self.operation_log_buffer = deque()
+        self.log_time_second = None
+        self.log_time_str = ""
+        
+        # Scratch buffer for packing write values (large enough for a double)
+        self.write_buffer = bytearray(8)
+        
+        # Samples handed over from the server thread, drained by a GUI timer
+        self.sample_queue = deque(maxlen=10000)
+        
         # Initialize UI
         self.init_ui()
         self.setup_connections()
         self.load_settings()
         
-        # Start the server in a separate thread
-        self.server_thread = threading.Thread(target=self.server.run)
-        self.server_thread.daemon = True
-        self.server_thread.start()
+        # Start the server; run() serves from its own daemon thread and returns.
+        # Binding happens here on the GUI thread, so a failure such as a busy
+        # port must not take the whole application down.
+        try:
+            self.server.run()
+        except Exception as e:
+            logger.error(f"Failed to start WebSocket server on port {self.server.port}: {e}")
+            self.update_status(f"Server failed to start on port {self.server.port}")
+            QMessageBox.critical(self, "Server Error",
+                                 f"Could not start the WebSocket server on port "
+                                 f"{self.server.port}:\n{e}")
         
         # Start connection status timer
+        self.last_client_ids = None
         self.connection_timer = QTimer()
         self.connection_timer.timeout.connect(self.update_connection_status)
         self.connection_timer.start(1000)
         
+        # Deliver queued samples to the table and plot
+        self.sample_timer = QTimer()
+        self.sample_timer.timeout.connect(self.drain_samples)
+        self.sample_timer.start(20)
+        
+        # Flush buffered event log lines at 10 Hz
+        self.log_flush_timer = QTimer()
+        self.log_flush_timer.timeout.connect(self.flush_log_buffer)
+        self.log_flush_timer.start(100)
+        
         logger.info("DataMonitorGUI initialization complete")
         
     def init_ui(self):
@@ -1125,7 +1539,7 @@ class DataMonitorGUI(QMainWindow):
         
         # Add connection status label to status bar
         self.connection_label = QLabel("● Disconnected")
-        self.connection_label.setStyleSheet("color: red; font-weight: bold; padding: 5px;")
+        self.connection_label.setObjectName("connectionLabel")
         self.status_bar.addPermanentWidget(self.connection_label)
         
         self.update_status("Server started on port 8000")
@@ -1186,17 +1600,17 @@ class DataMonitorGUI(QMainWindow):
         # NEW: Add Init/End buttons
         self.init_debug_btn = QPushButton("🚀 Initialize Debug")
         self.init_debug_btn.clicked.connect(self.initialize_debug_mode)
-        self.init_debug_btn.setStyleSheet("background-color: #2196F3;")
+        self.init_debug_btn.setObjectName("initDebugBtn")
 
         self.end_debug_btn = QPushButton("🛑 End Debug")
         self.end_debug_btn.clicked.connect(self.end_debug_mode)
         self.end_debug_btn.setEnabled(False)
-        self.end_debug_btn.setStyleSheet("background-color: #f44336;")
+        self.end_debug_btn.setObjectName("endDebugBtn")
 
         # NEW: ADD THIS - ELF Converter button
         self.elf_convert_btn = QPushButton("🔄 Convert ELF to CSV")
         self.elf_convert_btn.clicked.connect(self.run_elf_to_csv_converter)
-        self.elf_convert_btn.setStyleSheet("background-color: #9C27B0;")  # Purple color
+        self.elf_convert_btn.setObjectName("elfConvertBtn")
 
         self.upload_csv_btn = QPushButton("📁 Upload CSV")
         self.upload_csv_btn.clicked.connect(self.load_csv_file)
@@ -1250,6 +1664,7 @@ class DataMonitorGUI(QMainWindow):
         table_layout = QVBoxLayout()
         
         self.variable_table = QTableWidget()
+        self.value_items = {}  # Variable name -> "Current Value" cell
         self.variable_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.variable_table.customContextMenuRequested.connect(self.show_context_menu)
         self.variable_table.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -1274,9 +1689,11 @@ class DataMonitorGUI(QMainWindow):
         # Log area
         log_group = QGroupBox("Operation Log")
         log_layout = QVBoxLayout()
-        self.operation_log = QTextEdit()
+        self.operation_log = QPlainTextEdit()
         self.operation_log.setMaximumHeight(150)
         self.operation_log.setReadOnly(True)
+        self.operation_log.setMaximumBlockCount(500)
+        self.operation_log.setUndoRedoEnabled(False)
         log_layout.addWidget(self.operation_log)
         log_group.setLayout(log_layout)
         
@@ -1301,83 +1718,55 @@ class DataMonitorGUI(QMainWindow):
             self.showMaximized()
 
     def run_elf_to_csv_converter(self):
-        """Run the ELF to CSV converter script"""
-        try:
-            # Disable button during conversion
-            self.elf_convert_btn.setEnabled(False)
-            self.elf_convert_btn.setText("Converting...")
-            
-            # Update status
-            self.operation_log.append("Starting ELF to CSV conversion...")
-            self.update_status("Converting ELF file...")
-            
-            # Path to your converter script - adjust as needed
-            converter_script = Path(__file__).parent / "mem_map_buelf.py"
-            
-            # Run the converter script
-            result = subprocess.run(
-                ["python", str(converter_script)],
-                capture_output=True,
-                text=True,
-                cwd=Path(__file__).parent  # Set working directory
-            )
-            
-            # Check if successful
-            if result.returncode == 0:
-                self.operation_log.append("✅ ELF to CSV conversion completed successfully!")
-                self.update_status("ELF conversion complete")
-                
-                # Parse output to find the generated CSV file path
-                output_lines = result.stdout.strip().split('\n')
-                for line in output_lines:
-                    if '.csv' in line:
-                        self.operation_log.append(f"Generated: {line}")
-                
-                # Auto-load the most recent CSV file
-                csv_dir = Path(__file__).parent.parent / "data" / "csv"
-                if csv_dir.exists():
-                    csv_files = list(csv_dir.glob("*.csv"))
-                    if csv_files:
-                        # Get the most recent file
-                        latest_csv = max(csv_files, key=lambda f: f.stat().st_mtime)
-                        
-                        # Ask user if they want to load it
-                        reply = QMessageBox.question(
-                            self, "Load Generated CSV", 
-                            f"CSV file generated successfully!\n\n{latest_csv.name}\n\nDo you want to load it now?",
-                            QMessageBox.Yes | QMessageBox.No
-                        )
-                        
-                        if reply == QMessageBox.Yes:
-                            # Load it automatically
-                            if self.variable_manager.load_csv(str(latest_csv)):
-                                self.last_csv_file = str(latest_csv)
-                                self.populate_table()
-                                self.update_monitoring_variables()
-                                self.refresh_data_btn.setEnabled(True)
-                                self.write_data_btn.setEnabled(True)
-                                self.start_monitoring_btn.setEnabled(True)
-                                self.operation_log.append(f"✅ Loaded: {latest_csv.name}")
-                                self.update_status(f"CSV loaded: {latest_csv.name}")
-            else:
-                error_msg = result.stderr if result.stderr else "Unknown error"
-                self.operation_log.append(f"❌ ELF conversion failed: {error_msg}")
-                QMessageBox.critical(self, "Conversion Failed", 
-                                    f"Failed to convert ELF file:\n{error_msg}")
-        
-        except FileNotFoundError:
-            self.operation_log.append("❌ Converter script not found")
-            QMessageBox.critical(self, "Script Not Found", 
-                                "ELF to CSV converter script not found.\n"
-                                "Please ensure elf_to_csv_converter.py is in the correct location.")
-        except Exception as e:
-            self.operation_log.append(f"❌ Error: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Failed to run converter: {str(e)}")
+        """Run the ELF to CSV converter in the background"""
+        # Disable button during conversion
+        self.elf_convert_btn.setEnabled(False)
+        self.elf_convert_btn.setText("Converting...")
+        
+        # Update status
+        self.log_operation("Starting ELF to CSV conversion...")
+        self.update_status("Converting ELF file...")
+        
+        self.elf_convert_worker = ElfConvertWorker()
+        self.elf_convert_worker.conversion_completed.connect(self.on_elf_conversion_completed)
+        self.elf_convert_worker.start()
+    
+    def on_elf_conversion_completed(self, csv_path, error_msg):
+        """Report the converter result and offer to load the generated CSV"""
+        # Re-enable button
+        self.elf_convert_btn.setEnabled(True)
+        self.elf_convert_btn.setText("🔄 Convert ELF to CSV")
+        
+        if not csv_path:
+            self.log_operation(f"❌ ELF conversion failed: {error_msg}")
+            self.update_status("ELF conversion failed")
+            QMessageBox.critical(self, "Conversion Failed", 
+                                f"Failed to convert ELF file:\n{error_msg}")
+            return
         
-        finally:
-            # Re-enable button
-            self.elf_convert_btn.setEnabled(True)
-            self.elf_convert_btn.setText("🔄 Convert ELF to CSV")
+        latest_csv = Path(csv_path)
+        self.log_operation("✅ ELF to CSV conversion completed successfully!")
+        self.log_operation(f"Generated: {latest_csv}")
+        self.update_status("ELF conversion complete")
+        
+        # Ask user if they want to load it
+        reply = QMessageBox.question(
+            self, "Load Generated CSV", 
+            f"CSV file generated successfully!\n\n{latest_csv.name}\n\nDo you want to load it now?",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        
+        if reply == QMessageBox.Yes:
+            # Load it automatically
+            if self.variable_manager.load_csv(str(latest_csv)):
+                self.last_csv_file = str(latest_csv)
+                self.populate_table()
+                self.update_monitoring_variables()
+                self.refresh_data_btn.setEnabled(True)
+                self.write_data_btn.setEnabled(True)
+                self.start_monitoring_btn.setEnabled(True)
+                self.log_operation(f"✅ Loaded: {latest_csv.name}")
+                self.update_status(f"CSV loaded: {latest_csv.name}")
         
     def setup_monitoring_tab(self):
         layout = QVBoxLayout(self.monitoring_tab)
@@ -1411,9 +1800,12 @@ class DataMonitorGUI(QMainWindow):
         # Log area
         log_group = QGroupBox("Event Log")
         log_layout = QVBoxLayout()
-        self.log_text = QTextEdit()
+        # Plain text: appends skip rich-text parsing and layout
+        self.log_text = QPlainTextEdit()
         self.log_text.setMaximumHeight(200)
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(self.LOG_MAX_LINES)  # Oldest lines are dropped by Qt
+        self.log_text.setUndoRedoEnabled(False)  # No undo history for a read-only log
         log_layout.addWidget(self.log_text)
         log_group.setLayout(log_layout)
         
@@ -1432,6 +1824,9 @@ class DataMonitorGUI(QMainWindow):
         
         # File selection
         self.ota_file_btn = QPushButton("📁 Select Firmware File")
+        self.ota_firmware_file = None
+        self.ota_firmware_checksum = None  # MD5 from ChecksumWorker, reused by the handler
+        self.ota_file_dialog = None  # Created on first use, then reused
         self.ota_file_label = QLabel("No file selected")
         
         # Progress bar
@@ -1482,8 +1877,10 @@ class DataMonitorGUI(QMainWindow):
         # Log area
         log_group = QGroupBox("OTA Log")
         log_layout = QVBoxLayout()
-        self.ota_log = QTextEdit()
+        self.ota_log = QPlainTextEdit()
         self.ota_log.setReadOnly(True)
+        self.ota_log.setMaximumBlockCount(500)
+        self.ota_log.setUndoRedoEnabled(False)
         log_layout.addWidget(self.ota_log)
         log_group.setLayout(log_layout)
         
@@ -1495,6 +1892,9 @@ class DataMonitorGUI(QMainWindow):
         self.ota_file_btn.clicked.connect(self.select_ota_file)
         self.ota_start_btn.clicked.connect(self.start_ota_update)
         self.ota_cancel_btn.clicked.connect(self.cancel_ota_update)
+        self.ota_status_changed.connect(self.on_ota_status_changed)
+        self.ota_progress_changed.connect(self.ota_progress.setValue)
+        self.ota_log_message.connect(self.ota_log.appendPlainText)
 
     def show_context_menu(self, position):
         """Show context menu for table right-click"""
@@ -1559,16 +1959,16 @@ class DataMonitorGUI(QMainWindow):
             success = self.server.write_data_with_address(address, value, data_type)
             
             if success:
-                self.operation_log.append(f"✅ Written {value} to {var_name} at {address_str}")
+                self.log_operation(f"✅ Written {value} to {var_name} at {address_str}")
                 # Update current value column
                 self.variable_table.item(row, 4).setText(new_value_str)
             else:
-                self.operation_log.append(f"❌ Failed to write {var_name} at {address_str}")
+                self.log_operation(f"❌ Failed to write {var_name} at {address_str}")
                 
         except ValueError:
-            self.operation_log.append(f"❌ Invalid value for {var_name}")
+            self.log_operation(f"❌ Invalid value for {var_name}")
         except Exception as e:
-            self.operation_log.append(f"❌ Error writing {var_name}: {e}")
+            self.log_operation(f"❌ Error writing {var_name}: {e}")
 
     def _read_single_variable(self, row):
         """Helper method to read a single variable"""
@@ -1588,10 +1988,10 @@ class DataMonitorGUI(QMainWindow):
             upload_cmd = self.server.json_handler.create_upload_command(f"var_{row}")
             self.server.broadcast(upload_cmd)
             
-            self.operation_log.append(f"📖 Reading {var_name} from {address_str}")
+            self.log_operation(f"📖 Reading {var_name} from {address_str}")
             
         except Exception as e:
-            self.operation_log.append(f"❌ Error reading {var_name}: {e}")
+            self.log_operation(f"❌ Error reading {var_name}: {e}")
     
     def filter_variables(self, text):
         """Filter table rows based on search text"""
@@ -1619,7 +2019,7 @@ class DataMonitorGUI(QMainWindow):
                 self.refresh_data_btn.setEnabled(True)
                 self.write_data_btn.setEnabled(True)
                 self.start_monitoring_btn.setEnabled(True)
-                self.operation_log.append(f"Loaded CSV: {filename}")
+                self.log_operation(f"Loaded CSV: {filename}")
                 self.update_status(f"CSV loaded: {os.path.basename(filename)}")
             else:
                 QMessageBox.critical(self, "Error", "Failed to load CSV file")
@@ -1710,8 +2110,13 @@ class DataMonitorGUI(QMainWindow):
         """Populate table with variables from CSV"""
         variables = self.variable_manager.variables
         self.variable_table.setRowCount(0)
+        self.value_items = {}
         
         for var in variables:
+            # Calculate the addresses of all elements once per variable
+            addresses = self.variable_manager.get_element_addresses(
+                var['address'], var['elements'], var['data_type']
+            )
             for i in range(var['elements']):
                 row_position = self.variable_table.rowCount()
                 self.variable_table.insertRow(row_position)
@@ -1723,10 +2128,6 @@ class DataMonitorGUI(QMainWindow):
                     name_item = QTableWidgetItem(var['name'])
                 name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
                 
-                # Calculate address for this element
-                addresses = self.variable_manager.get_element_addresses(
-                    var['address'], var['elements'], var['data_type']
-                )
                 address_item = QTableWidgetItem(f"0x{addresses[i]:08X}")
                 address_item.setFlags(address_item.flags() & ~Qt.ItemIsEditable)
                 
@@ -1753,17 +2154,26 @@ class DataMonitorGUI(QMainWindow):
                 self.variable_table.setItem(row_position, 3, type_item)
                 self.variable_table.setItem(row_position, 4, current_value_item)
                 self.variable_table.setItem(row_position, 5, new_value_item)
+                
+                # Index the value cell by name for incoming samples
+                self.value_items[name_item.text()] = current_value_item
 
         self.debug_table_contents()
     
     def debug_table_contents(self):
         """Debug helper to print all table variable names"""
-        logger.info("=== TABLE CONTENTS DEBUG ===")
-        for row in range(self.variable_table.rowCount()):
-            var_name = self.variable_table.item(row, 0).text() if self.variable_table.item(row, 0) else "None"
-            address = self.variable_table.item(row, 1).text() if self.variable_table.item(row, 1) else "None"
-            logger.info(f"Row {row}: Name='{var_name}', Address='{address}'")
-        logger.info("=== END TABLE DEBUG ===")
+        table = self.variable_table
+        
+        def cell_text(row, column):
+            item = table.item(row, column)
+            return item.text() if item else "None"
+        
+        # Build the dump as one message rather than one log record per row
+        lines = "\n".join(
+            f"Row {row}: Name='{cell_text(row, 0)}', Address='{cell_text(row, 1)}'"
+            for row in range(table.rowCount())
+        )
+        logger.info(f"=== TABLE CONTENTS DEBUG ===\n{lines}\n=== END TABLE DEBUG ===")
     
     def update_monitoring_variables(self):
         """Update monitoring combo box with loaded variables"""
@@ -1771,14 +2181,20 @@ class DataMonitorGUI(QMainWindow):
         self.parameter_combo.addItem("All Variables")
         
         # Add all variables to combo box
+        plot_parameters = []
         for var in self.variable_manager.variables:
             if var['elements'] > 1:
                 # For arrays, add both the base name and individual elements
                 self.parameter_combo.addItem(var['name'])  # Base name for whole array
                 for i in range(var['elements']):
                     self.parameter_combo.addItem(f"{var['name']}[{i}]")  # Individual elements
+                    plot_parameters.append(f"{var['name']}[{i}]")
             else:
                 self.parameter_combo.addItem(var['name'])
+                plot_parameters.append(var['name'])
+        
+        # Set up plot curves now rather than on the first sample
+        self.plot_widget.prepare_curves(plot_parameters)
         
         logger.info(f"Updated monitoring combo with {self.parameter_combo.count()} items")
     
@@ -1788,7 +2204,7 @@ class DataMonitorGUI(QMainWindow):
             QMessageBox.warning(self, "No Connection", "No clients connected")
             return
         
-        self.operation_log.append("Starting data refresh...")
+        self.log_operation("Starting data refresh...")
         
         for row in range(self.variable_table.rowCount()):
             address_str = self.variable_table.item(row, 1).text()
@@ -1805,9 +2221,9 @@ class DataMonitorGUI(QMainWindow):
             self.server.broadcast(upload_cmd)
             time.sleep(0.1)
             
-            self.operation_log.append(f"Reading from address {address_str}")
+            self.log_operation(f"Reading from address {address_str}")
         
-        self.operation_log.append("Data refresh completed")
+        self.log_operation("Data refresh completed")
     
     def write_all_data(self):
         """Write data for all variables"""
@@ -1824,7 +2240,7 @@ class DataMonitorGUI(QMainWindow):
         if reply != QMessageBox.Yes:
             return
         
-        self.operation_log.append("Starting data write...")
+        self.log_operation("Starting data write...")
         
         for row in range(self.variable_table.rowCount()):
             address_str = self.variable_table.item(row, 1).text()
@@ -1840,35 +2256,23 @@ class DataMonitorGUI(QMainWindow):
                 success = self.server.write_data_with_address(address, value, data_type)
                 
                 if success:
-                    self.operation_log.append(f"✅ Written {value} to {var_name} at {address_str}")
+                    self.log_operation(f"✅ Written {value} to {var_name} at {address_str}")
                 else:
-                    self.operation_log.append(f"❌ Failed to write {var_name} at {address_str}")
+                    self.log_operation(f"❌ Failed to write {var_name} at {address_str}")
                 
                 time.sleep(0.2)  # Small delay between writes
                 
             except ValueError as e:
-                self.operation_log.append(f"❌ Error writing {var_name}: Invalid value '{new_value_str}'")
+                self.log_operation(f"❌ Error writing {var_name}: Invalid value '{new_value_str}'")
             except Exception as e:
-                self.operation_log.append(f"❌ Error writing {var_name}: {e}")
+                self.log_operation(f"❌ Error writing {var_name}: {e}")
                 
-        self.operation_log.append("Data write completed")
+        self.log_operation("Data write completed")
     
     def value_to_bytes(self, value, data_type):
         """Convert a value to bytes based on data type"""
-        import struct
-        
-        format_map = {
-            'uint8_t': 'B',
-            'int8_t': 'b', 
-            'uint16_t': 'H',
-            'int16_t': 'h',
-            'uint32_t': 'I', 
-            'int32_t': 'i',
-            'float': 'f',
-            'double': 'd'
-        }
-        
-        fmt = format_map.get(data_type, 'f')
+        packer = self.VALUE_PACKERS.get(data_type, self.VALUE_PACKERS['float'])
+        fmt = packer.format[-1]
         
         try:
             if fmt in ['B', 'H', 'I']:
@@ -1878,15 +2282,11 @@ class DataMonitorGUI(QMainWindow):
             else:
                 value = float(value)
                 
-            packed = struct.pack('<' + fmt, value)
-            byte_list = list(packed)
-            
-            if len(byte_list) < 4:
-                byte_list.extend([0] * (4 - len(byte_list)))
-            elif len(byte_list) > 4:
-                byte_list = byte_list[:4]
-                
-            return byte_list
+            # Pack in place; the first 4 bytes are zero-padded or truncated
+            buf = self.write_buffer
+            buf[:4] = b'\x00\x00\x00\x00'
+            packer.pack_into(buf, 0, value)
+            return list(buf[:4])
             
         except Exception as e:
             logger.error(f"Error converting {value} to bytes: {e}")
@@ -1895,6 +2295,7 @@ class DataMonitorGUI(QMainWindow):
     def clear_table(self):
         """Clear the variable table"""
         self.variable_table.setRowCount(0)
+        self.value_items = {}
         self.variable_manager.variables = []
         self.parameter_combo.clear()
         self.parameter_combo.addItem("All Variables")
@@ -1903,52 +2304,66 @@ class DataMonitorGUI(QMainWindow):
         self.start_monitoring_btn.setEnabled(False)
     
     def on_data_received(self, parameter, value, timestamp):
-        """Handle received data with thread safety and ensure plot updates"""
+        """Queue a sample from the server thread for the GUI thread"""
+        # deque.append is atomic, so the server thread never blocks on Qt
+        self.sample_queue.append((parameter, value, timestamp))
+    
+    def drain_samples(self):
+        """Apply all queued samples on the GUI thread"""
+        sample_queue = self.sample_queue
+        drained = 0
+        latest = {}
+        # One lock for the whole batch rather than one per sample
         with QMutexLocker(self.data_mutex):
-            logger.debug(f"Data received - Parameter: {parameter}, Value: {value}, Timestamp: {timestamp}")
-            
-            # Update table - improved matching logic
-            updated = False
-            
-            # Search through all rows to find matching variable
-            for row in range(self.variable_table.rowCount()):
-                var_name_item = self.variable_table.item(row, 0)
-                if var_name_item:
-                    var_name = var_name_item.text()
-                    
-                    # Exact match (for both single vars and array elements)
-                    if var_name == parameter:
-                        try:
-                            current_value_item = self.variable_table.item(row, 4)
-                            if current_value_item:
-                                current_value_item.setText(f"{value:.3f}")
-                                logger.info(f"Updated table {var_name} with value {value:.3f}")
-                                updated = True
-                                break
-                        except Exception as e:
-                            logger.error(f"Error updating table row {row}: {e}")
-            
-            if not updated:
-                logger.warning(f"Could not find table row for parameter '{parameter}'")
-            
-            # ALWAYS emit signal for plotting regardless of table update
-            # This ensures the plot gets the data even if table update fails
-            try:
-                self.data_received.emit(parameter, float(value), float(timestamp))
-                logger.debug(f"Emitted plot signal for {parameter}: {value}")
-            except Exception as e:
-                logger.error(f"Error emitting plot signal: {e}")
+            while sample_queue:
+                parameter, value, timestamp = sample_queue.popleft()
+                self.apply_sample(parameter, value, timestamp)
+                latest[parameter] = value
+                drained += 1
+            
+            # The table only shows the newest value, so update each row once per batch
+            for parameter, value in latest.items():
+                self.update_table_value(parameter, value)
+        
+        if drained:
+            logger.debug("Delivered %d samples to table and plot", drained)
+    
+    def apply_sample(self, parameter, value, timestamp):
+        """Apply one sample to the plot and log (caller holds data_mutex)"""
+        logger.debug("Data received - Parameter: %s, Value: %s, Timestamp: %s", parameter, value, timestamp)
+        
+        # Already on the GUI thread, so call the consumers directly
+        # rather than going through a signal per sample
+        try:
+            value = float(value)
+            timestamp = float(timestamp)
+            self.plot_widget.update_plot(parameter, value, timestamp)
+            self.log_data(parameter, value, timestamp)
+        except Exception as e:
+            logger.error(f"Error delivering sample to plot: {e}")
+    
+    def update_table_value(self, parameter, value):
+        """Show the latest value of a parameter in the variable table"""
+        # Exact match (for both single vars and array elements)
+        current_value_item = self.value_items.get(parameter)
+        if current_value_item is None:
+            logger.debug("Could not find table row for parameter '%s'", parameter)
+            return
+        
+        try:
+            current_value_item.setText(f"{value:.3f}")
+            logger.debug("Updated table %s with value %.3f", parameter, value)
+        except Exception as e:
+            logger.error(f"Error updating table value for {parameter}: {e}")
     
     def setup_connections(self):
-        self.data_received.connect(self.plot_widget.update_plot)
-        self.data_received.connect(self.log_data)
         self.export_btn.clicked.connect(self.export_data)
         self.clear_plot_btn.clicked.connect(self.plot_widget.clear_data)
         self.parameter_combo.currentTextChanged.connect(self.on_parameter_changed)
         
         # NEW: Connect thread-safe logging signals
-        self.log_message.connect(self.log_text.append)
-        self.operation_log_message.connect(self.operation_log.append)
+        self.log_message.connect(self.log_text.appendPlainText)
+        self.operation_log_message.connect(self.log_operation)
         
     def start_monitoring(self):
         """Start continuous monitoring of variables."""
@@ -1966,7 +2381,7 @@ class DataMonitorGUI(QMainWindow):
         self.start_monitoring_btn.setEnabled(False)
         self.stop_monitoring_btn.setEnabled(True)
         self.update_status("Monitoring started")
-        self.operation_log.append("✅ Monitoring started")
+        self.log_operation("✅ Monitoring started")
         
     def stop_monitoring(self):
         logger.info("Stopping variable monitoring")
@@ -1974,19 +2389,38 @@ class DataMonitorGUI(QMainWindow):
         self.start_monitoring_btn.setEnabled(True)
         self.stop_monitoring_btn.setEnabled(False)
         self.update_status("Monitoring stopped")
-        self.operation_log.append("Monitoring stopped")
+        self.log_operation("Monitoring stopped")
     
     def log_data(self, parameter, value, timestamp):
-        time_str = time.strftime('%H:%M:%S', time.localtime(timestamp))
-        log_msg = f"{time_str} - {parameter}: {value:.2f}"
-        self.log_text.append(log_msg)
-        
-        if self.log_text.document().blockCount() > 1000:
-            cursor = self.log_text.textCursor()
-            cursor.movePosition(cursor.Start)
-            cursor.select(cursor.LineUnderCursor)
-            cursor.removeSelectedText()
-            cursor.deleteChar()
+        # Samples within the same second share one formatted time string
+        second = int(timestamp)
+        if second != self.log_time_second:
+            self.log_time_second = second
+            self.log_time_str = time.strftime('%H:%M:%S', time.localtime(second))
+        log_msg = f"{self.log_time_str} - {parameter}: {value:.2f}"
+        self.log_buffer.append(log_msg)
+    
+    def log_operation(self, message):
+        """Queue a line for the operation log"""
+        self.operation_log_buffer.append(message)
+    
+    def flush_log_buffer(self):
+        """Append all buffered event and operation log lines in a single edit each"""
+        if self.log_buffer:
+            self.append_log_batch(self.log_text, self.log_buffer)
+        if self.operation_log_buffer:
+            self.append_log_batch(self.operation_log, self.operation_log_buffer)
+
+    def append_log_batch(self, view, buffer):
+        """Append buffered lines to a log view with repaints held until the end"""
+        # Appending past the block cap also trims the top of the document;
+        # keep both from painting separately and repaint once afterwards
+        view.setUpdatesEnabled(False)
+        try:
+            view.appendPlainText('\n'.join(buffer))
+        finally:
+            view.setUpdatesEnabled(True)
+        buffer.clear()
 
     def debug_plot_data(self):
         """Debug method to check what data is in the plot"""
@@ -2040,65 +2474,125 @@ class DataMonitorGUI(QMainWindow):
     def export_data(self):
         """Export current plot data to CSV"""
         if hasattr(self.plot_widget, 'data_points') and self.plot_widget.data_points:
-            if DataExporter.export_to_csv(self.plot_widget.data_points):
-                self.update_status("Data exported successfully")
-                self.log_text.append("Data exported to CSV file")
-            else:
-                self.update_status("Failed to export data")
+            filename, _ = QFileDialog.getSaveFileName(
+                self, "Save Data", "", "CSV Files (*.csv);;All Files (*)"
+            )
+            if not filename:
+                return
+            
+            # Snapshot on the GUI thread, write the file in the background
+            self.export_btn.setEnabled(False)
+            self.update_status("Exporting data...")
+            self.export_worker = ExportWorker(
+                DataExporter.snapshot(self.plot_widget.data_points), filename)
+            self.export_worker.export_completed.connect(self.on_export_completed)
+            self.export_worker.start()
         else:
             QMessageBox.warning(self, "No Data", "No data available to export")
     
+    def on_export_completed(self, success, filename):
+        """Handle the end of a background CSV export"""
+        self.export_btn.setEnabled(True)
+        if success:
+            self.update_status("Data exported successfully")
+            self.log_text.appendPlainText("Data exported to CSV file")
+        else:
+            self.update_status("Failed to export data")
+    
     def select_ota_file(self):
         """Select firmware file for OTA update"""
-        filename, _ = QFileDialog.getOpenFileName(
-            self, "Select Firmware File", "",
-            "Binary Files (*.bin);;Hex Files (*.hex);;All Files (*)"
-        )
+        # Reuse one dialog so the platform dialog does not rescan drives and
+        # default locations on every open
+        if self.ota_file_dialog is None:
+            self.ota_file_dialog = QFileDialog(self, "Select Firmware File")
+            self.ota_file_dialog.setNameFilters(
+                ["Binary Files (*.bin)", "Hex Files (*.hex)", "All Files (*)"])
+            self.ota_file_dialog.setFileMode(QFileDialog.ExistingFile)
+            last_dir = self.settings.value("last_firmware_dir")
+            if last_dir and os.path.isdir(last_dir):
+                self.ota_file_dialog.setDirectory(last_dir)
+        
+        filename = None
+        if self.ota_file_dialog.exec_() == QDialog.Accepted:
+            filename = self.ota_file_dialog.selectedFiles()[0]
+            self.settings.setValue("last_firmware_dir", os.path.dirname(filename))
         
         if filename:
+            self.ota_firmware_file = filename
+            self.ota_firmware_checksum = None
             self.ota_file_label.setText(os.path.basename(filename))
-            self.ota_start_btn.setEnabled(True)
+            self.ota_start_btn.setEnabled(False)
             
-            # Get file info
-            file_size = os.path.getsize(filename)
-            self.ota_file_size_label.setText(f"File Size: {file_size:,} bytes")
+            self.ota_log.appendPlainText(f"Selected firmware: {filename}")
             
-            # Calculate checksum
-            import hashlib
-            with open(filename, 'rb') as f:
-                checksum = hashlib.md5(f.read()).hexdigest()
-            self.ota_checksum_label.setText(f"Checksum: {checksum[:16]}...")
-            
-            self.ota_log.append(f"Selected firmware: {filename}")
+            # Size and checksum come from the worker, read from one open of the
+            # file in the background; large images would freeze the GUI
+            self.ota_file_size_label.setText("File Size: -")
+            self.ota_checksum_label.setText("Checksum: calculating...")
+            self.checksum_worker = ChecksumWorker(filename)
+            self.checksum_worker.checksum_completed.connect(self.on_checksum_completed)
+            self.checksum_worker.start()
+    
+    def on_checksum_completed(self, filename, checksum, file_size):
+        """Show the firmware size and checksum once the worker has finished"""
+        if filename != self.ota_firmware_file:
+            return  # A newer file was selected meanwhile
+        
+        if not checksum:
+            self.ota_checksum_label.setText("Checksum: unavailable")
+            self.ota_log.appendPlainText(f"Cannot read firmware file {filename}")
+            return
+        
+        self.ota_firmware_checksum = checksum
+        self.ota_file_size_label.setText(f"File Size: {file_size:,} bytes")
+        self.ota_checksum_label.setText(f"Checksum: {checksum[:16]}...")
+        self.ota_start_btn.setEnabled(True)
     
     def start_ota_update(self):
         """Start OTA update process"""
+        # Index 0 is "All Devices"
+        if self.ota_device_combo.currentIndex() > 0:
+            device_ids = [self.ota_device_combo.currentText()]
+        else:
+            device_ids = None
+        
         self.ota_start_btn.setEnabled(False)
         self.ota_cancel_btn.setEnabled(True)
         self.ota_progress.setVisible(True)
         self.ota_progress.setValue(0)
         
-        self.ota_log.append("Starting OTA update...")
+        self.ota_log.appendPlainText("Starting OTA update...")
         self.ota_status_label.setText("Updating...")
         
-        # Simulate OTA progress
-        self.ota_timer = QTimer()
-        self.ota_timer.timeout.connect(self.update_ota_progress)
-        self.ota_timer.start(100)
-        self.ota_progress_value = 0
+        # The handler streams the firmware in chunks from its worker thread;
+        # pass the checksum already computed so the image is not hashed again here
+        if not self.ota_handler.start_update(self.ota_firmware_file, device_ids,
+                                             checksum=self.ota_firmware_checksum):
+            self.ota_log.appendPlainText("OTA update could not be started")
+            self.reset_ota_controls()
+    
+    def emit_ota_status(self, status, message):
+        """OTAHandler status callback; forwards to the GUI thread as a signal"""
+        self.ota_status_changed.emit(status.value, message)
     
-    def update_ota_progress(self):
-        """Update OTA progress (simulation)"""
-        self.ota_progress_value += 1
-        self.ota_progress.setValue(self.ota_progress_value)
+    def on_ota_status_changed(self, status, message):
+        """Reflect OTA handler status changes in the OTA tab"""
+        self.ota_status_label.setText(message or status)
         
-        if self.ota_progress_value >= 100:
-            self.ota_timer.stop()
+        if status == OTAStatus.COMPLETED.value:
             self.ota_complete()
+        elif status in (OTAStatus.FAILED.value, OTAStatus.CANCELLED.value):
+            self.reset_ota_controls()
+    
+    def reset_ota_controls(self):
+        """Return the OTA controls to their idle state"""
+        self.ota_progress.setVisible(False)
+        self.ota_start_btn.setEnabled(self.ota_firmware_file is not None)
+        self.ota_cancel_btn.setEnabled(False)
     
     def ota_complete(self):
         """Complete OTA update"""
-        self.ota_log.append("OTA update completed successfully!")
+        self.ota_log.appendPlainText("OTA update completed successfully!")
         self.ota_status_label.setText("Update Complete")
         self.ota_start_btn.setEnabled(True)
         self.ota_cancel_btn.setEnabled(False)
@@ -2106,14 +2600,9 @@ class DataMonitorGUI(QMainWindow):
     
     def cancel_ota_update(self):
         """Cancel OTA update"""
-        if hasattr(self, 'ota_timer'):
-            self.ota_timer.stop()
-        
-        self.ota_progress.setVisible(False)
-        self.ota_start_btn.setEnabled(True)
-        self.ota_cancel_btn.setEnabled(False)
-        self.ota_status_label.setText("Update Cancelled")
-        self.ota_log.append("OTA update cancelled by user")
+        # The handler reports CANCELLED once the transfer has stopped
+        self.ota_handler.cancel_update()
+        self.ota_log.appendPlainText("OTA update cancellation requested by user")
     
     def show_settings_dialog(self):
         """Show settings dialog"""
@@ -2135,27 +2624,42 @@ class DataMonitorGUI(QMainWindow):
     
     def update_connection_status(self):
         """Update connection status indicator"""
-        if hasattr(self.server, 'clients') and self.server.clients:
-            client_count = len(self.server.clients)
+        # Only touch the label and device list when the client set changes
+        # The server thread adds and removes clients; read them under its lock
+        client_ids = self.server.client_ids()
+        if client_ids == self.last_client_ids:
+            return
+        self.last_client_ids = client_ids
+        
+        if client_ids:
+            client_count = len(client_ids)
             self.connection_label.setText(f"● Connected ({client_count} clients)")
-            self.connection_label.setStyleSheet("color: green; font-weight: bold; padding: 5px;")
-            
-            # Update OTA device list
-            if hasattr(self, 'ota_device_combo'):
-                current_devices = [self.ota_device_combo.itemText(i) 
-                                for i in range(1, self.ota_device_combo.count())]
-                
-                for client_id in self.server.clients.keys():
-                    client_id_str = str(client_id)  # ✅ CONVERT TO STRING
-                    if client_id_str not in current_devices:
-                        self.ota_device_combo.addItem(client_id_str)
         else:
             self.connection_label.setText("● Disconnected")
-            self.connection_label.setStyleSheet("color: red; font-weight: bold; padding: 5px;")
-            
-            if hasattr(self, 'ota_device_combo'):
-                self.ota_device_combo.clear()
-                self.ota_device_combo.addItem("All Devices")
+        
+        # The color comes from the app stylesheet; re-polish to apply it
+        self.connection_label.setProperty("connected", bool(client_ids))
+        self.connection_label.style().unpolish(self.connection_label)
+        self.connection_label.style().polish(self.connection_label)
+        
+        if hasattr(self, 'ota_device_combo'):
+            self.update_ota_devices({str(client_id) for client_id in client_ids})
+    
+    def update_ota_devices(self, device_ids):
+        """Sync the OTA device list in place, keeping "All Devices" at index 0"""
+        combo = self.ota_device_combo
+        
+        # Drop departed devices (backwards so indices stay valid), then add new ones
+        current_devices = set()
+        for i in range(combo.count() - 1, 0, -1):
+            device_id = combo.itemText(i)
+            if device_id in device_ids:
+                current_devices.add(device_id)
+            else:
+                combo.removeItem(i)
+        
+        for device_id in sorted(device_ids - current_devices):
+            combo.addItem(device_id)
     
     def update_status(self, message):
         self.status_bar.showMessage(message)
@@ -2180,21 +2684,54 @@ class DataMonitorGUI(QMainWindow):
             self.settings.setValue("last_csv_file", self.last_csv_file)
     
     def closeEvent(self, event):
-        logger.info("Application closing, performing cleanup")
+        if self.server_stopped:
+            logger.info("Application cleanup complete")
+            event.accept()
+            return
+        
+        # Server teardown can block for seconds (monitoring join, end command,
+        # serve loop exit), so run it off the GUI thread and close when done
+        event.ignore()
+        if self.shutdown_thread is not None:
+            return
         
+        logger.info("Application closing, performing cleanup")
         self.save_settings()
-        self.server.stop_monitoring()
+        self.hide()
         
-        if hasattr(self.server, 'server'):
-            self.server.server.shutdown()
+        self.shutdown_thread = threading.Thread(target=self.shutdown_server, daemon=True)
+        self.shutdown_thread.start()
+    
+    def shutdown_server(self):
+        """Stop monitoring and the WebSocket server (runs on a worker thread)"""
+        try:
+            self.server.stop_monitoring()
             
-        logger.info("Application cleanup complete")
-        event.accept()
+            if getattr(self.server, 'server', None):
+                self.server.server.shutdown()
+        except Exception as e:
+            logger.error(f"Error during server shutdown: {e}")
+        finally:
+            self.server_shutdown_finished.emit()
+    
+    def on_server_shutdown_finished(self):
+        """Close the window once the server has stopped"""
+        self.server_stopped = True
+        self.close()
+        # The window is already hidden, so closing it may not end the event loop
+        QApplication.quit()
 
 def main():
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     
+    # Draw plot curves through OpenGL when PyOpenGL is available
+    try:
+        import OpenGL  # noqa: F401
+        pg.setConfigOptions(useOpenGL=True, antialias=False)
+    except ImportError:
+        logger.info("PyOpenGL not installed, using software plot rendering")
+    
     # Set application-wide stylesheet for modern look
     app.setStyleSheet("""
         QMainWindow {
@@ -2248,6 +2785,29 @@ def main():
         QTableWidget::item:hover {
             background-color: #e3f2fd;
         }
+        QPushButton#initDebugBtn {
+            background-color: #2196F3;
+        }
+        QPushButton#endDebugBtn {
+            background-color: #f44336;
+        }
+        QPushButton#elfConvertBtn {
+            background-color: #9C27B0;
+        }
+        QLabel#connectionLabel {
+            color: red;
+            font-weight: bold;
+            padding: 5px;
+        }
+        QLabel#connectionLabel[connected="true"] {
+            color: green;
+        }
+        QPlainTextEdit#testOutput {
+            background-color: #1e1e1e;
+            color: #d4d4d4;
+            font-family: 'Consolas', 'Courier New', monospace;
+            font-size: 10pt;
+        }
     """)
     
     logger.info("Starting GUI application")
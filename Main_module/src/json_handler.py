@@ -10,6 +10,16 @@ sys.path.append(project_root)
 
 from src.logger_config import get_module_logger
 
+try:
+    import orjson
+    json_loads = orjson.loads
+    # websocket_server sends str messages, so decode orjson's UTF-8 bytes
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
 class JSONHandler:
     """Handler for JSON message processing with new protocol communication support."""
     
@@ -23,6 +33,7 @@ class JSONHandler:
     MSG_TYPE_DATA = 'data'
     MSG_TYPE_COMMAND = 'command'
     MSG_TYPE_ERROR = 'error'
+    MSG_TYPE_BATCH = 'batch'
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize JSONHandler with optional configuration."""
@@ -53,14 +64,23 @@ class JSONHandler:
             if not self.validate_message_size(message):
                 return {'type': self.MSG_TYPE_ERROR, 'message': 'Message too large'}
 
-            self.logger.debug(f"Processing message: {message}")
+            self.logger.debug("Processing message: %s", message)
             
             # Parse JSON
-            data = json.loads(message)
+            data = json_loads(message)
             
             if not isinstance(data, dict):
                 return {'type': self.MSG_TYPE_ERROR, 'message': 'Expected JSON object'}
             
+            # Check if it's a batch of responses from the gateway
+            if data.get('type') == self.MSG_TYPE_BATCH:
+                items = data.get('items', [])
+                return {
+                    'type': self.MSG_TYPE_BATCH,
+                    'items': [self._process_response(item) for item in items
+                              if isinstance(item, dict) and 'res' in item]
+                }
+            
             # Check if it's a response
             if 'res' in data:
                 return self._process_response(data)
@@ -77,7 +97,7 @@ class JSONHandler:
     def _process_response(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Process response messages from client."""
         res_type = data.get('res', '')
-        self.logger.debug(f"Processing response type: {res_type}")
+        self.logger.debug("Processing response type: %s", res_type)
         
         if res_type == 'init':
             return {
@@ -141,8 +161,8 @@ class JSONHandler:
             "cmd": "init",
             "con_id": con_id
         }
-        json_cmd = json.dumps(command)
-        self.logger.debug(f"Created init command: {json_cmd}")
+        json_cmd = json_dumps(command)
+        self.logger.debug("Created init command: %s", json_cmd)
         return json_cmd
     
     def create_mem_read_command(self, address: str, size: str = "08") -> str:
@@ -156,8 +176,8 @@ class JSONHandler:
             "add": address,
             "size": size
         }
-        json_cmd = json.dumps(command)
-        self.logger.debug(f"Created mem_read command: {json_cmd}")
+        json_cmd = json_dumps(command)
+        self.logger.debug("Created mem_read command: %s", json_cmd)
         return json_cmd
     
     def create_mem_write_command(self, address: str, size: str, data: Any, data_type: str = 'uint32_t') -> str:
@@ -175,8 +195,8 @@ class JSONHandler:
             "size": size,
             "data": data_binary  # Now properly formatted as "0bXXXXXXXX"
         }
-        json_cmd = json.dumps(command)
-        self.logger.debug(f"Created mem_write command: {json_cmd}")
+        json_cmd = json_dumps(command)
+        self.logger.debug("Created mem_write command: %s", json_cmd)
         return json_cmd
     
     def convert_to_binary(self, value: Any, data_type: str, size: str) -> str:
@@ -247,7 +267,7 @@ class JSONHandler:
             padded_binary = binary_digits.zfill(bit_width)  # Pad to bit_width
             final_binary = '0b' + padded_binary
             
-            self.logger.debug(f"Converted {value} ({data_type}) to {final_binary}")
+            self.logger.debug("Converted %s (%s) to %s", value, data_type, final_binary)
             return final_binary
             
         except Exception as e:
@@ -264,8 +284,8 @@ class JSONHandler:
             "cmd": "end",
             "con_id": con_id
         }
-        json_cmd = json.dumps(command)
-        self.logger.debug(f"Created end command: {json_cmd}")
+        json_cmd = json_dumps(command)
+        self.logger.debug("Created end command: %s", json_cmd)
         return json_cmd
 
     def get_data_size_from_type(self, data_type: str) -> str:
@@ -316,7 +336,7 @@ class JSONHandler:
         size = size_map.get(data_type_clean)
         
         if size:
-            self.logger.debug(f"Mapped data type '{data_type}' to size '{size}'")
+            self.logger.debug("Mapped data type '%s' to size '%s'", data_type, size)
             return size
         
         # If no exact match, try to extract bit size from the type name
@@ -327,7 +347,7 @@ class JSONHandler:
             if bit_size in ['8', '16', '32', '64']:
                 if len(bit_size) == 1:
                     bit_size = '0' + bit_size  # Pad single digit
-                self.logger.debug(f"Extracted size '{bit_size}' from data type '{data_type}'")
+                self.logger.debug("Extracted size '%s' from data type '%s'", bit_size, data_type)
                 return bit_size
         
         # Log warning for unknown type
@@ -29,9 +29,16 @@ class CustomFormatter(logging.Formatter):
         logging.CRITICAL: f"{BOLD_RED}%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s{RESET}"
     }
     
+    def __init__(self):
+        super().__init__()
+        # Build one formatter per level up front instead of one per record
+        self.formatters = {
+            level: logging.Formatter(log_fmt, datefmt='%Y-%m-%d %H:%M:%S')
+            for level, log_fmt in self.FORMATS.items()
+        }
+    
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno, self.FORMATS[logging.DEBUG])
-        formatter = logging.Formatter(log_fmt, datefmt='%Y-%m-%d %H:%M:%S')
+        formatter = self.formatters.get(record.levelno, self.formatters[logging.DEBUG])
         return formatter.format(record)
 
 def setup_logging(app_name="WebSocketServer", log_level=logging.INFO):
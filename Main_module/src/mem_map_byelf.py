@@ -10,11 +10,6 @@ base_dir = Path(__file__).resolve().parent.parent  # go up from src/
 elf_file_path = base_dir / "data" / "elf" / "XCP_slave_disco.elf"
 
 
-if not os.path.exists(elf_file_path):
-    print(f"ELF file '{elf_file_path}' not found.")
-    exit(1)
-
-
 # Patterns for library-related / non-user-defined variables
 EXCLUDE_PATTERNS = [
     r'^RCC_.*', r'^GPIO_.*', r'^hspi$', r'^tickstart$', r'^status$', r'^pllvco$',
@@ -94,52 +89,67 @@ def get_array_details(dwarfinfo, type_ref_offset):
 
 
 
-elf_basename = os.path.splitext(os.path.basename(elf_file_path))[0]
-timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H%M%S")
-output_dir = base_dir / "data" / "csv"
-output_dir.mkdir(parents=True, exist_ok=True)
-output_csv = os.path.join(output_dir, f"{elf_basename}_{timestamp}.csv")
+def convert(elf_path=elf_file_path):
+    """Write the user-defined variables of an ELF file to a new CSV file.
+
+    Returns the path of the CSV file and the CSV lines that were written.
+    """
+    if not os.path.exists(elf_path):
+        raise FileNotFoundError(f"ELF file '{elf_path}' not found.")
 
+    elf_basename = os.path.splitext(os.path.basename(elf_path))[0]
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H%M%S")
+    output_dir = base_dir / "data" / "csv"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_csv = os.path.join(output_dir, f"{elf_basename}_{timestamp}.csv")
 
-user_defined_vars = []
-try:
-    with open(output_csv, "w") as csv_file:
-        csv_file.write("Variable,Address,No of Elements,Type\n")
-        elf = ELFFile(open(elf_file_path, "rb"))
+    user_defined_vars = []
+    with open(elf_path, "rb") as elf_stream:
+        elf = ELFFile(elf_stream)
         if not elf.has_dwarf_info():
-            print("No DWARF info found in the ELF file.")
-            exit(1)
+            raise ValueError("No DWARF info found in the ELF file.")
 
         dwarfinfo = elf.get_dwarf_info()
-        variable_found = False
-
-        for CU in dwarfinfo.iter_CUs():
-            for DIE in CU.iter_DIEs():
-                if DIE.tag == "DW_TAG_variable":
-                    name = DIE.attributes.get("DW_AT_name")
-                    loc = DIE.attributes.get("DW_AT_location")
-                    vartype = DIE.attributes.get("DW_AT_type")
-                    if name and loc:
-                        variable_name = name.value.decode()
-                        address = get_memory_address(loc.value)
-                        if address.startswith("[145,"):
-                            continue
-                        if is_user_defined_variable(variable_name):
-                            variable_found = True
-                            elements, var_type = (None, None)
-                            if vartype:
-                                elements, var_type = get_array_details(dwarfinfo, vartype.raw_value)
-                            if elements is not None and var_type is not None:
-                                pass
-                            else:
-                                elements = 1
-                                var_type = "Uint32_t"
-                            csv_line = f"{variable_name},{address},{elements},{var_type}"
-                            user_defined_vars.append(csv_line)
-                            csv_file.write(f"{csv_line}\n")
-
-        if not variable_found:
-            print("No user-defined variables found.")
+
+        with open(output_csv, "w") as csv_file:
+            csv_file.write("Variable,Address,No of Elements,Type\n")
+
+            for CU in dwarfinfo.iter_CUs():
+                for DIE in CU.iter_DIEs():
+                    if DIE.tag == "DW_TAG_variable":
+                        name = DIE.attributes.get("DW_AT_name")
+                        loc = DIE.attributes.get("DW_AT_location")
+                        vartype = DIE.attributes.get("DW_AT_type")
+                        if name and loc:
+                            variable_name = name.value.decode()
+                            address = get_memory_address(loc.value)
+                            if address.startswith("[145,"):
+                                continue
+                            if is_user_defined_variable(variable_name):
+                                elements, var_type = (None, None)
+                                if vartype:
+                                    elements, var_type = get_array_details(dwarfinfo, vartype.raw_value)
+                                if elements is not None and var_type is not None:
+                                    pass
+                                else:
+                                    elements = 1
+                                    var_type = "Uint32_t"
+                                csv_line = f"{variable_name},{address},{elements},{var_type}"
+                                user_defined_vars.append(csv_line)
+                                csv_file.write(f"{csv_line}\n")
+
+    return output_csv, user_defined_vars
+
+
+if __name__ == "__main__":
+    try:
+        output_csv, user_defined_vars = convert()
+    except (FileNotFoundError, ValueError) as e:
+        print(e)
+        exit(1)
+
+    if not user_defined_vars:
+        print("No user-defined variables found.")
 
     if os.path.exists(output_csv) and os.path.getsize(output_csv) > 0:
         print("User defines:")
@@ -147,6 +157,3 @@ try:
             print(var)
     else:
         print(f"{output_csv} is empty or was not created.")
-
-except Exception:
-    pass  
@@ -106,14 +106,22 @@ class OTAHandler:
     
     def _update_progress(self, progress: int):
         """Update progress and notify callbacks"""
+        # Many chunks map to the same percentage; only report visible changes
+        if progress == self.progress:
+            return
         self.progress = progress
         if self.progress_callback:
             self.progress_callback(progress)
     
-    def validate_firmware(self, firmware_path: str) -> Tuple[bool, Optional[FirmwareInfo]]:
+    def validate_firmware(self, firmware_path: str,
+                          checksum: Optional[str] = None) -> Tuple[bool, Optional[FirmwareInfo]]:
         """
         Validate firmware file
         
+        Args:
+            firmware_path: Path to firmware file
+            checksum: MD5 of the file if already known; computed otherwise
+        
         Returns:
             Tuple of (success, FirmwareInfo or None)
         """
@@ -128,8 +136,9 @@ class OTAHandler:
             file_size = os.path.getsize(firmware_path)
             file_name = os.path.basename(firmware_path)
             
-            # Calculate checksum
-            checksum = self._calculate_checksum(firmware_path)
+            # Calculate checksum unless the caller already has it
+            if not checksum:
+                checksum = self._calculate_checksum(firmware_path)
             
             # Extract version from filename or metadata
             version = self._extract_version(firmware_path)
@@ -208,23 +217,27 @@ class OTAHandler:
         logger.debug(f"Found {len(devices)} connected devices")
         return devices
     
-    def start_update(self, firmware_path: str, device_ids: List[str] = None) -> bool:
+    def start_update(self, firmware_path: str, device_ids: List[str] = None,
+                     checksum: Optional[str] = None) -> bool:
         """
         Start OTA update process
         
         Args:
             firmware_path: Path to firmware file
             device_ids: List of device IDs to update (None for all)
+            checksum: MD5 of the firmware if already known, skips re-hashing
         
         Returns:
             Success status
         """
-        if self.status != OTAStatus.IDLE:
+        # A finished, failed or cancelled update leaves its status behind,
+        # so only a live worker thread means an update is in progress
+        if self.update_thread is not None and self.update_thread.is_alive():
             logger.warning("OTA update already in progress")
             return False
         
         # Validate firmware first
-        success, firmware_info = self.validate_firmware(firmware_path)
+        success, firmware_info = self.validate_firmware(firmware_path, checksum)
         if not success:
             return False
         
@@ -241,6 +254,7 @@ class OTAHandler:
         
         # Start update in separate thread
         self.cancel_flag.clear()
+        self.progress = 0
         self.update_thread = threading.Thread(target=self._update_workflow)
         self.update_thread.daemon = True
         self.update_thread.start()
@@ -358,6 +372,7 @@ class OTAHandler:
         
         for device_id in self.target_devices:
             if self.cancel_flag.is_set():
+                self._update_status(OTAStatus.CANCELLED, "Verification cancelled")
                 return False
             
             # Send verify command
@@ -368,8 +383,10 @@ class OTAHandler:
             if self.server:
                 self._send_to_device(device_id, verify_cmd)
             
-            # Wait for verification response (simplified)
-            time.sleep(1)
+            # Wait for verification response (simplified); a cancel ends the wait
+            if self.cancel_flag.wait(1):
+                self._update_status(OTAStatus.CANCELLED, "Verification cancelled")
+                return False
         
         self._update_progress(90)
         logger.info("Firmware verification complete")
@@ -382,6 +399,7 @@ class OTAHandler:
         
         for device_id in self.target_devices:
             if self.cancel_flag.is_set():
+                self._update_status(OTAStatus.CANCELLED, "Installation cancelled")
                 return False
             
             # Send install command
@@ -390,8 +408,10 @@ class OTAHandler:
             if self.server:
                 self._send_to_device(device_id, install_cmd)
             
-            # Wait for installation
-            time.sleep(2)
+            # Wait for installation; a cancel ends the wait
+            if self.cancel_flag.wait(2):
+                self._update_status(OTAStatus.CANCELLED, "Installation cancelled")
+                return False
         
         logger.info("Firmware installation initiated")
         return True
@@ -411,7 +431,9 @@ class OTAHandler:
     
     def cancel_update(self):
         """Cancel ongoing OTA update"""
-        if self.status in [OTAStatus.TRANSFERRING, OTAStatus.PREPARING]:
+        # Every phase on the worker thread checks the flag and reports CANCELLED
+        if self.status in [OTAStatus.PREPARING, OTAStatus.TRANSFERRING,
+                           OTAStatus.VERIFYING, OTAStatus.INSTALLING]:
             self.cancel_flag.set()
             logger.info("OTA update cancellation requested")
     
@@ -24,6 +24,8 @@ class WebSocketServer:
         self.host = host
         self.port = port
         self.clients = {}
+        # Guards changes to self.clients, which other threads read
+        self.clients_lock = threading.Lock()
         self.monitoring_active = False
         self.monitoring_thread = None
         self.server = None
@@ -41,18 +43,19 @@ class WebSocketServer:
 
     def new_client(self, client, server):
         client_id = client['id']
-        self.clients[client_id] = client
+        with self.clients_lock:
+            self.clients[client_id] = client
         logger.info(f"New client connected (ID: {client_id}). Total clients: {len(self.clients)}")
 
     def client_left(self, client, server):
         client_id = client['id']
-        if client_id in self.clients:
-            del self.clients[client_id]
+        with self.clients_lock:
+            self.clients.pop(client_id, None)
         logger.info(f"Client disconnected (ID: {client_id}). Total clients: {len(self.clients)}")
 
     def message_received(self, client, server, message):
         try:
-            logger.debug(f"Message received from client {client['id']}: {message}")
+            logger.debug("Message received from client %s: %s", client['id'], message)
             self.process_message(client, message)
         except Exception as e:
             logger.error(f"Error processing message from client {client['id']}: {e}")
@@ -62,6 +65,14 @@ class WebSocketServer:
         """Process message with new protocol."""
         result = self.json_handler.process_message(message)
         
+        if result['type'] == 'batch':
+            for item in result['items']:
+                self.handle_result(item)
+        else:
+            self.handle_result(result)
+    
+    def handle_result(self, result):
+        """Dispatch a single processed protocol message."""
         if result['type'] == 'response':
             logger.info(f"Response received - Command: {result.get('command')}, Status: {result.get('status')}")
             
@@ -314,7 +325,7 @@ class WebSocketServer:
                     
                     # Get data size based on type - WITH LOGGING
                     data_size = self.json_handler.get_data_size_from_type(data_type)
-                    logger.debug(f"Variable '{var_name}' type '{data_type}' mapped to size '{data_size}' bits")
+                    logger.debug("Variable '%s' type '%s' mapped to size '%s' bits", var_name, data_type, data_size)
                     
                     # Calculate element size in bytes for address calculation
                     byte_size_map = {
@@ -343,13 +354,13 @@ class WebSocketServer:
                         # Send mem_read command with CORRECT SIZE
                         read_cmd = self.json_handler.create_mem_read_command(addr_hex, data_size)
                         self.broadcast(read_cmd)
-                        logger.debug(f"Sent: {read_cmd}")  # Log the actual command
+                        logger.debug("Sent: %s", read_cmd)  # Log the actual command
                         
                         # Wait for response
                         response = self.wait_for_response('mem_read', timeout=5.0)
                         
                         if response and response.get('type') == 'data':
-                            logger.debug(f"Received data for {param_name}: {response.get('value')}")
+                            logger.debug("Received data for %s: %s", param_name, response.get('value'))
                         else:
                             logger.warning(f"No response for {param_name} at {addr_hex}")
                         
@@ -425,21 +436,30 @@ class WebSocketServer:
             for client_id in list(self.clients.keys()):
                 try:
                     self.server.send_message(self.clients[client_id], message)
-                    logger.debug(f"Message sent to client {client_id}: {message}")
+                    logger.debug("Message sent to client %s: %s", client_id, message)
                 except Exception as e:
                     logger.error(f"Error sending message to client {client_id}: {e}")
                     # Remove disconnected client
-                    if client_id in self.clients:
-                        del self.clients[client_id]
+                    with self.clients_lock:
+                        removed = self.clients.pop(client_id, None)
+                    if removed is not None:
                         logger.info(f"Removed disconnected client {client_id}")
 
+    def client_ids(self):
+        """Snapshot of the connected client ids, safe to call from any thread"""
+        with self.clients_lock:
+            return frozenset(self.clients)
+
     def send_to_client(self, client_id: str, message: str):
         """Send message to specific client"""
+        # Device lists carry ids as strings; websocket_server ids are ints
+        if isinstance(client_id, str) and client_id.isdigit():
+            client_id = int(client_id)
         if client_id in self.clients and self.server:
             try:
                 client = self.clients[client_id]
                 self.server.send_message(client, message)
-                logger.debug(f"Message sent to client {client_id}")
+                logger.debug("Message sent to client %s", client_id)
                 return True
             except Exception as e:
                 logger.error(f"Error sending to client {client_id}: {e}")
@@ -0,0 +1,65 @@
+"""
+Tests for DataExporter file exports
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+try:
+    from gui import DataExporter, SampleTable
+except ImportError as e:  # PyQt5 / pyqtgraph / numpy not installed
+    DataExporter = None
+    GUI_IMPORT_ERROR = str(e)
+else:
+    GUI_IMPORT_ERROR = ""
+
+try:
+    import xlsxwriter
+    import openpyxl
+except ImportError:
+    xlsxwriter = None
+
+
+@unittest.skipIf(DataExporter is None, f"GUI module unavailable: {GUI_IMPORT_ERROR}")
+@unittest.skipIf(xlsxwriter is None, "xlsxwriter and openpyxl are required")
+class TestExcelExport(unittest.TestCase):
+    """Excel export must keep every column of every row"""
+
+    def setUp(self):
+        self.data_points = SampleTable(capacity=8)
+        for pid, parameter in enumerate(("speed", "temp")):
+            self.data_points.add_parameter(parameter)
+            for i in range(3):
+                self.data_points.append(pid, 10.0 * pid + i, 1700000000.0 + i)
+
+        fd, self.filename = tempfile.mkstemp(suffix=".xlsx")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_write_xlsx_keeps_all_columns(self):
+        DataExporter.write_xlsx(xlsxwriter, DataExporter.snapshot(self.data_points),
+                                self.filename)
+
+        rows = list(openpyxl.load_workbook(self.filename).active.iter_rows(values_only=True))
+        self.assertEqual(list(rows[0]), DataExporter.EXCEL_COLUMNS)
+        self.assertEqual(len(rows), 7)
+        for row in rows[1:]:
+            self.assertTrue(all(cell is not None for cell in row), row)
+        self.assertEqual(rows[1][:3], ("speed", 0.0, 1700000000.0))
+        self.assertEqual(rows[6][:3], ("temp", 12.0, 1700000002.0))
+
+    def test_write_xlsx_empty_snapshot_writes_header(self):
+        DataExporter.write_xlsx(xlsxwriter, [], self.filename)
+
+        rows = list(openpyxl.load_workbook(self.filename).active.iter_rows(values_only=True))
+        self.assertEqual(rows, [tuple(DataExporter.EXCEL_COLUMNS)])
+
+
+if __name__ == "__main__":
+    unittest.main()
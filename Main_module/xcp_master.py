@@ -1,6 +1,5 @@
 import json
 from websocket_server import WebsocketServer
-from datetime import datetime
 import threading
 import logging
 import time